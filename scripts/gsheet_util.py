@@ -229,6 +229,24 @@ def _normalize_key(key: str) -> str:
     return key.strip().lower().replace(" ", "_")
 
 
+def _values_to_rows(values: list[list[str]]) -> list[dict[str, str]]:
+    """Converts a raw values range to a list of dicts (first row = headers)."""
+    if not values:
+        return []
+
+    headers = [_normalize_key(h) for h in values[0]]
+    rows = []
+    for row_values in values[1:]:
+        row_dict = {}
+        for i, val in enumerate(row_values):
+            if i < len(headers):
+                key = headers[i]
+                row_dict[key] = val.strip()
+        if row_dict:
+            rows.append(row_dict)
+    return rows
+
+
 class GSheet:
     def __init__(self, sheet_id: str, creds_path: str | pl.Path | None = None):
         self.sheet_id = sheet_id
@@ -244,8 +262,8 @@ class GSheet:
 
     def _get_headers(self, sheet_name: str) -> list[str]:
         if sheet_name not in self._headers_cache:
-            # We fetch a wide range to get all potential headers in the first row
-            range_name = f"{sheet_name}!A1:Z1"
+            # The whole first row, so headers beyond column Z are found too
+            range_name = f"{sheet_name}!1:1"
             try:
                 result = (
                     self.service().spreadsheets()
@@ -286,21 +304,22 @@ class GSheet:
             .get(spreadsheetId=self.sheet_id, range=range_name)
             .execute()
         )
-        values = result.get("values", [])
-        if not values:
-            return []
-
-        headers = [_normalize_key(h) for h in values[0]]
-        rows = []
-        for row_values in values[1:]:
-            row_dict = {}
-            for i, val in enumerate(row_values):
-                if i < len(headers):
-                    key = headers[i]
-                    row_dict[key] = val.strip()
-            if row_dict:
-                rows.append(row_dict)
-        return rows
+        return _values_to_rows(result.get("values", []))
+
+    def batch_read(self, sheet_names: list[str]) -> dict[str, list[dict[str, str]]]:
+        """Reads several sheets with a single batchGet request (one RTT, one quota unit)."""
+        ranges = [f"{sheet_name}!A1:Z5000" for sheet_name in sheet_names]
+        result = (
+            self.service().spreadsheets()
+            .values()
+            .batchGet(spreadsheetId=self.sheet_id, ranges=ranges)
+            .execute()
+        )
+        value_ranges = result.get("valueRanges", [])
+        return {
+            sheet_name: _values_to_rows(value_range.get("values", []))
+            for sheet_name, value_range in zip(sheet_names, value_ranges)
+        }
 
     def append(self, sheet_name: str, rows: list[dict[str, typ.Any]]):
         """Appends dictionaries as rows, matching keys to existing headers."""
@@ -324,7 +343,7 @@ class GSheet:
                 service=self.service(),
                 sheet_id=self.sheet_id,
                 sheet_name=sheet_name,
-                range_name="A1:Z1",
+                range_name="1:1",
                 rows=[norm_headers]
             )
             self._headers_cache[sheet_name] = norm_headers
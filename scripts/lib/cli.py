@@ -3,11 +3,13 @@
 # requires-python = ">=3.13"
 # dependencies = ["pudb", "ipython"]
 # ///
+import io
 import re
 import sys
 import json
 import logging
 import argparse
+import functools as ft
 
 
 _option_pattern = r"""
@@ -168,8 +170,15 @@ def _init_arg_parser(doc: str, defaults: dict[str, str]) -> argparse.ArgumentPar
     return parser
 
 
+# Docstrings are module constants, so the docstring scans and argparse
+# construction only need to happen once per process.
+@ft.lru_cache(maxsize=None)
+def _cached_arg_parser(doc: str, defaults_items: tuple) -> argparse.ArgumentParser:
+    return _init_arg_parser(doc, dict(defaults_items))
+
+
 def parse_args(argv: list[str], doc: str, defaults: dict[str, str] = {}) -> tuple[str, argparse.Namespace]:
-    parser = _init_arg_parser(doc, defaults)
+    parser = _cached_arg_parser(doc, tuple(sorted(defaults.items())))
     args = parser.parse_args(argv)
     return getattr(args, "subcmd", None), args
 
@@ -199,50 +208,85 @@ def init_logging(args: argparse.Namespace) -> None:
     )
 
 
-def _json_dumps_pretty(obj: dict | list | str | int | float | bool | None, lvl: int = 0) -> str:
+# Writing into one buffer avoids the O(N) intermediate strings the old
+# per-level "".join() implementation allocated for large structures
+# (e.g. the full cities.json list).
+def _write_json_pretty(obj: dict | list | str | int | float | bool | None, out: io.StringIO, lvl: int = 0) -> None:
     if obj is None:
-        return "null"
+        out.write("null")
     elif isinstance(obj, str):
-        return json.dumps(obj)
+        out.write(json.dumps(obj))
     elif isinstance(obj, bool):
-        return str(obj).lower()
+        out.write(str(obj).lower())
     elif isinstance(obj, (int, float)):
-        return str(obj)
-    if isinstance(obj, tuple):
-        return _json_dumps_pretty(list(obj), lvl=lvl)
+        out.write(str(obj))
+    elif isinstance(obj, tuple):
+        _write_json_pretty(list(obj), out, lvl=lvl)
     elif isinstance(obj, list):
         has_nested = any(isinstance(item, (list, dict, tuple)) for item in obj)
         if has_nested:
             indent_str = "  " * (lvl + 1)
-            closing_indent = "  " * lvl
-            return "[\n" + ",\n".join(indent_str + _json_dumps_pretty(item, lvl=lvl + 1) for item in obj) + "\n" + closing_indent + "]"
+            out.write("[\n")
+            for i, item in enumerate(obj):
+                if i:
+                    out.write(",\n")
+                out.write(indent_str)
+                _write_json_pretty(item, out, lvl=lvl + 1)
+            out.write("\n" + "  " * lvl + "]")
         else:
-            return "[" + ", ".join(_json_dumps_pretty(item) for item in obj) + "]"
+            out.write("[")
+            for i, item in enumerate(obj):
+                if i:
+                    out.write(", ")
+                _write_json_pretty(item, out)
+            out.write("]")
     elif isinstance(obj, dict):
         has_nested = any(isinstance(item, (list, dict, tuple)) for item in obj.values())
         if has_nested or len(obj) > 4:
             indent_str = "  " * (lvl + 1)
-            closing_indent = "  " * lvl
-            return "{\n" + ",\n".join(indent_str + json.dumps(key) + ': ' + _json_dumps_pretty(val, lvl=lvl + 1) for key, val in obj.items()) + "\n" + closing_indent + "}"
+            out.write("{\n")
+            for i, (key, val) in enumerate(obj.items()):
+                if i:
+                    out.write(",\n")
+                out.write(indent_str + json.dumps(key) + ': ')
+                _write_json_pretty(val, out, lvl=lvl + 1)
+            out.write("\n" + "  " * lvl + "}")
         else:
-            return "{" + ", ".join(json.dumps(key) + ': ' + _json_dumps_pretty(val) for key, val in obj.items()) + "}"
+            out.write("{")
+            for i, (key, val) in enumerate(obj.items()):
+                if i:
+                    out.write(", ")
+                out.write(json.dumps(key) + ': ')
+                _write_json_pretty(val, out)
+            out.write("}")
     else:
         raise ValueError("Unsupported type: " + type(obj).__name__)
 
 
+def _json_dumps_pretty(obj: dict | list | str | int | float | bool | None, lvl: int = 0) -> str:
+    out = io.StringIO()
+    _write_json_pretty(obj, out, lvl=lvl)
+    return out.getvalue()
+
+
 def json_dumps_pretty(obj: dict | list | str | int | float | bool | None) -> str:
-    fallback = json.dumps(obj, indent=2)
-    expected = json.loads(fallback)
     try:
         result = _json_dumps_pretty(obj)
-        if json.loads(result) == expected:
-            return result
-        else:
-            log.warning("json_dumps encode error. fallback to builtin")
     except Exception as ex:
         log.warning(f"json_dumps encode error. fallback to builtin {ex}")
-
-    return fallback
+        return json.dumps(obj, indent=2)
+
+    if __debug__:
+        # paranoia round-trip, skipped under python -O
+        try:
+            if json.loads(result) != json.loads(json.dumps(obj)):
+                log.warning("json_dumps encode error. fallback to builtin")
+                return json.dumps(obj, indent=2)
+        except Exception as ex:
+            log.warning(f"json_dumps encode error. fallback to builtin {ex}")
+            return json.dumps(obj, indent=2)
+
+    return result
 
 
 
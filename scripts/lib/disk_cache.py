@@ -3,10 +3,12 @@
 # requires-python = ">=3.13"
 # dependencies = [ ]
 # ///
+import dbm
 import sys
 import json
 import time
 import shelve
+import sqlite3
 import tempfile
 import typing as typ
 import pathlib as pl
@@ -34,23 +36,25 @@ def load_cache(filename: str) -> CachedDict:
     # NOTE: Read from cache file can fail if written to concurrently.
     #       Retry until successful.
     # TODO: Semaphore?
-    if fpath.exists():
-        done = False
-        while not done:
-            try:
-                with shelve.open(fpath, flag="r") as cache_db:
-                    _CACHE_BY_FILENAME[filename] = dict(cache_db.items())
-                done = True
-            except PermissionError:
-                time.sleep(0.5)
-    else:
-        _CACHE_BY_FILENAME[filename] = {}
+    done = False
+    while not done:
+        try:
+            with shelve.open(fpath, flag="r") as cache_db:
+                _CACHE_BY_FILENAME[filename] = dict(cache_db.items())
+            done = True
+        except dbm.error:
+            # no cache file yet; some dbm backends use their own file
+            # suffixes, so we can't just check fpath.exists()
+            _CACHE_BY_FILENAME[filename] = {}
+            done = True
+        except PermissionError:
+            time.sleep(0.5)
 
     cache_sizes[filename] = len(_CACHE_BY_FILENAME[filename])
     return _CACHE_BY_FILENAME[filename]
 
 
-def dump_cache(filename: str, cache: CachedDict | None) -> None:
+def dump_cache(filename: str, cache: CachedDict | None = None) -> None:
     # if cache_sizes[filename] == len(_CACHE_BY_FILENAME):
     #     return
 
@@ -78,6 +82,23 @@ def cache_ctx(filename: str) -> typ.Generator[CachedDict, None, None]:
     dump_cache(filename)
 
 
+# One sqlite file per cache instead of a shelve re-read/re-write per
+# call: lookups are a single indexed SELECT and WAL batches the fsyncs.
+_DB_CONNS: dict[str, sqlite3.Connection] = {}
+
+
+def _get_db(filename: str) -> sqlite3.Connection:
+    conn = _DB_CONNS.get(filename)
+    if conn is None:
+        fpath = _cache_filepath(filename + ".sqlite3")
+        conn = sqlite3.connect(fpath, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, payload TEXT)")
+        _DB_CONNS[filename] = conn
+    return conn
+
+
 def cache(name: str = "__sentinel__"):
     def decorator(func: typ.Callable):
         if name == "__sentinel__":
@@ -98,16 +119,19 @@ def cache(name: str = "__sentinel__"):
                 parts.append(str(val))
 
             key = "-".join(parts)
-            # if key in CACHE:
-            #     if '"area_plz"' in CACHE[key]:
-            #         CACHE.pop(key)
 
-            cache = load_cache(filename)
-            if key not in cache:
+            db = _get_db(filename)
+            row = db.execute("SELECT payload FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
                 result = func(*args, **kwargs)
-                cache[key] = json.dumps(result)
-                dump_cache(filename, cache)
-            return json.loads(cache[key])
+                payload = json.dumps(result)
+                db.execute("INSERT OR REPLACE INTO cache (key, payload) VALUES (?, ?)", (key, payload))
+            else:
+                payload = row[0]
+
+            # json round-trip also for fresh results, so cached and
+            # uncached calls return identical types (tuples -> lists)
+            return json.loads(payload)
 
         return dec
 
@@ -5,8 +5,9 @@
 #   "pudb", "ipython",
 #   "pillow>=11.1.0",
 #   "telethon>=1.42.0",
-#   "python-telegram-bot>=22.5",
+#   "python-telegram-bot[job-queue]>=22.5",
 #   "python-dateutil",
+#   "orjson",
 # ]
 # ///
 """
@@ -30,50 +31,159 @@ import os
 import re
 import sys
 import json
-import uuid
 import time
+import asyncio
 import logging
+import sqlite3
 import pathlib as pl
 import datetime as dt
 import zoneinfo as zi
+import functools as ft
+import collections
 
 TZ_BERLIN = zi.ZoneInfo("Europe/Berlin")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from lib import cli
 
 log = logging.getLogger('telegram_bot')
 
+# NOTE: explicit raise instead of assert, so the check survives `python -O`
+#   and we fail before any of the heavy telegram/telethon imports.
 API_ID = os.environ.get('FSTISCH_API_ID')
 API_HASH = os.environ.get('FSTISCH_API_HASH')
-assert API_ID, "missing envvar: FSTISCH_API_ID"
-assert API_HASH, "missing envvar: FSTISCH_API_HASH"
+if not API_ID:
+    raise RuntimeError("missing envvar: FSTISCH_API_ID")
+if not API_HASH:
+    raise RuntimeError("missing envvar: FSTISCH_API_HASH")
 
 BOT_ID = 'freiheitliche-stammtische-sync'
 BOT_NAME = "@FreiheitlicheStammtischeBot"
 BOT_TOKEN = os.environ.get('FSTISCH_BOT_TOKEN')
 
-assert BOT_TOKEN, "missing envvar: FSTISCH_BOT_TOKEN"
+if not BOT_TOKEN:
+    raise RuntimeError("missing envvar: FSTISCH_BOT_TOKEN")
+
+# Chat bookkeeping lives in SQLite instead of a read-modify-write JSON
+# file. The old approach reparsed and rewrote the full state for every
+# update; the upsert below is O(1) per chat.
+DB_FILE = pl.Path("data") / "telegram_bot.sqlite"
+
+_DB_CONN: sqlite3.Connection | None = None
+
+
+def _db() -> sqlite3.Connection:
+    global _DB_CONN
+    if _DB_CONN is None:
+        DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _DB_CONN = sqlite3.connect(DB_FILE, isolation_level=None)
+        _DB_CONN.execute("PRAGMA journal_mode=WAL")
+        _DB_CONN.execute("PRAGMA synchronous=NORMAL")
+        _DB_CONN.execute("""
+            CREATE TABLE IF NOT EXISTS chats(
+                id         TEXT PRIMARY KEY,
+                category   TEXT,
+                type       TEXT,
+                title      TEXT,
+                username   TEXT,
+                first_name TEXT,
+                last_name  TEXT,
+                last_seen  TEXT,
+                peer_kind  TEXT
+            )
+        """)
+        # migration for databases created before the peer_kind column
+        columns = {row[1] for row in _DB_CONN.execute("PRAGMA table_info(chats)")}
+        if "peer_kind" not in columns:
+            _DB_CONN.execute("ALTER TABLE chats ADD COLUMN peer_kind TEXT")
+        _DB_CONN.execute("CREATE INDEX IF NOT EXISTS idx_chats_category ON chats(category)")
+    return _DB_CONN
+
+
+_CATEGORY_BY_TYPE = {
+    "group"     : "groups",
+    "supergroup": "groups",
+    "channel"   : "channels",
+}
 
-STATE_FILE = pl.Path("data") / "telegram_bot.json"
 
+def _chat_category(chat_type: str) -> str:
+    return _CATEGORY_BY_TYPE.get(chat_type, "users")
 
-def _load_state() -> dict:
-    if not STATE_FILE.exists():
-        return {"users": {}, "groups": {}, "channels": {}}
 
-    with STATE_FILE.open(mode="r", encoding="utf-8") as fobj:
-        try:
-            return json.load(fobj)
-        except json.JSONDecodeError:
-            return {"users": {}, "groups": {}, "channels": {}}
+# Skip writes for chats whose info is unchanged; a bare last_seen bump is
+# only persisted every 5 minutes, so steady-state chatter stays off the disk.
+_LAST_SEEN_WRITE_INTERVAL = 300
 
+_CHAT_WRITE_CACHE: dict[str, tuple] = {}  # chat_id -> (fields, monotonic ts)
 
-def _save_state(state: dict) -> None:
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = STATE_FILE.with_suffix(f".tmp-{uuid.uuid4().hex}")
-    with temp_path.open(mode="w", encoding="utf-8") as fobj:
-        json.dump(state, fobj, indent=2, ensure_ascii=False)
-    temp_path.replace(STATE_FILE)
+
+def _upsert_chat(info: dict) -> None:
+    chat_id = str(info["id"])
+    fields = (
+        info["type"],
+        info.get("title"),
+        info.get("username"),
+        info.get("first_name"),
+        info.get("last_name"),
+        info.get("peer_kind"),
+    )
+    now = time.monotonic()
+    cached = _CHAT_WRITE_CACHE.get(chat_id)
+    if cached and cached[0] == fields and (now - cached[1]) < _LAST_SEEN_WRITE_INTERVAL:
+        return
+
+    _db().execute(
+        """
+        INSERT INTO chats(id, category, type, title, username, first_name, last_name, last_seen, peer_kind)
+        VALUES (:id, :category, :type, :title, :username, :first_name, :last_name, :last_seen, :peer_kind)
+        ON CONFLICT(id) DO UPDATE SET
+            category=excluded.category,
+            type=excluded.type,
+            title=excluded.title,
+            username=excluded.username,
+            first_name=excluded.first_name,
+            last_name=excluded.last_name,
+            last_seen=excluded.last_seen,
+            peer_kind=COALESCE(excluded.peer_kind, chats.peer_kind)
+        """,
+        {
+            "id": chat_id,
+            "category": _chat_category(info["type"]),
+            "type": info["type"],
+            "title": info.get("title"),
+            "username": info.get("username"),
+            "first_name": info.get("first_name"),
+            "last_name": info.get("last_name"),
+            "last_seen": info.get("last_seen"),
+            "peer_kind": info.get("peer_kind"),
+        },
+    )
+    _CHAT_WRITE_CACHE[chat_id] = (fields, now)
+
+
+def _load_chats() -> dict[str, dict]:
+    """Returns {"users": {id: info}, "groups": ..., "channels": ...}."""
+    state = {"users": {}, "groups": {}, "channels": {}}
+    cursor = _db().execute(
+        "SELECT id, category, type, title, username, first_name, last_name, last_seen, peer_kind FROM chats"
+    )
+    for id_, category, type_, title, username, first_name, last_name, last_seen, peer_kind in cursor:
+        state[category][id_] = {
+            "id": int(id_) if id_.lstrip("-").isdigit() else id_,
+            "type": type_,
+            "title": title,
+            "username": username,
+            "first_name": first_name,
+            "last_name": last_name,
+            "last_seen": last_seen,
+            "peer_kind": peer_kind,
+        }
+    return state
 
 
 async def get_chats(bot: "telegram.Bot"):
@@ -86,27 +196,46 @@ async def get_chats(bot: "telegram.Bot"):
         }
 
 
+# Fields the bot actually reads. Everything else is dropped after parsing
+# to keep the resident set small.
+_TERMIN_KEYS = ("name", "beginn", "uhrzeit", "plz", "telegram_group_id")
+
+
+@ft.lru_cache(maxsize=1)
 def _load_termine_by_gid() -> dict[str, list]:
     data_path = pl.Path("data") / "termine.json"
-    with data_path.open(mode='r', encoding="utf-8") as fobj:
-        termine = json.load(fobj)
+    # One buffered read; json.load would go through the TextIOWrapper
+    # decoder in many small reads.
+    data = data_path.read_bytes()
+    termine = orjson.loads(data) if orjson else json.loads(data)
 
-    termine_by_telegram_group_id = {}
+    termine_by_telegram_group_id = collections.defaultdict(list)
     for t in termine:
         gid = t.get('telegram_group_id')
         if not gid:
             continue
-        if gid not in termine_by_telegram_group_id:
-            termine_by_telegram_group_id[gid] = []
+        # Intern the gid so the many termine of one group share a single
+        # str object (and dict probes compare by identity).
+        gid = sys.intern(gid)
+        t = {k: t[k] for k in _TERMIN_KEYS if k in t}
+        t['telegram_group_id'] = gid
         termine_by_telegram_group_id[gid].append(t)
-    return termine_by_telegram_group_id
+    return dict(termine_by_telegram_group_id)
+
+
+def refresh_termine() -> dict[str, list]:
+    """Drops the cached index and re-reads data/termine.json."""
+    _load_termine_by_gid.cache_clear()
+    return _load_termine_by_gid()
 
 
-def _update_state_from_chat(state: dict, chat: "telegram.Chat") -> None:
+def _update_state_from_chat(chat: "telegram.Chat", now_iso: str | None = None) -> None:
     if not chat:
         return
 
-    chat_id = str(chat.id)
+    if now_iso is None:
+        now_iso = dt.datetime.now(TZ_BERLIN).isoformat()
+
     info = {
         "id": chat.id,
         "type": chat.type,
@@ -114,94 +243,99 @@ def _update_state_from_chat(state: dict, chat: "telegram.Chat") -> None:
         "username": getattr(chat, 'username', None),
         "first_name": getattr(chat, 'first_name', None),
         "last_name": getattr(chat, 'last_name', None),
-        "last_seen": dt.datetime.now(TZ_BERLIN).isoformat()
+        "last_seen": now_iso,
     }
+    _upsert_chat(info)
 
-    if "users" not in state:
-        state["users"] = {}
-    if "groups" not in state:
-        state["groups"] = {}
-    if "channels" not in state:
-        state["channels"] = {}
-
-    if chat.type in ("group", "supergroup"):
-        state["groups"][chat_id] = info
-    elif chat.type == "channel":
-        state["channels"][chat_id] = info
-    else:
-        state["users"][chat_id] = info
-
-
-def _update_state_from_update(state: dict, update: 'telegram.Update') -> None:
-    # Exhaustively look for any chat object in the update
-    chat = None
-    sources = [
-        update.effective_chat,
-        update.message.chat if update.message else None,
-        update.edited_message.chat if update.edited_message else None,
-        update.my_chat_member.chat if update.my_chat_member else None,
-        update.chat_member.chat if update.chat_member else None,
-        update.channel_post.chat if update.channel_post else None,
-        update.edited_channel_post.chat if update.edited_channel_post else None,
-        update.callback_query.message.chat if (update.callback_query and update.callback_query.message) else None,
-        update.chat_join_request.chat if update.chat_join_request else None,
-        update.chat_boost.chat if update.chat_boost else None,
-        update.removed_chat_boost.chat if update.removed_chat_boost else None,
-    ]
-    
-    for s in sources:
-        if s:
-            chat = s
-            break
+
+def _update_state_from_update(update: 'telegram.Update', now_iso: str | None = None) -> None:
+    # Exhaustively look for any chat object in the update.
+    # Checked in order, stopping at the first hit; effective_chat covers
+    # nearly all updates, so the fallbacks are rarely evaluated.
+    chat = update.effective_chat
+    if not chat and update.message:
+        chat = update.message.chat
+    if not chat and update.edited_message:
+        chat = update.edited_message.chat
+    if not chat and update.my_chat_member:
+        chat = update.my_chat_member.chat
+    if not chat and update.chat_member:
+        chat = update.chat_member.chat
+    if not chat and update.channel_post:
+        chat = update.channel_post.chat
+    if not chat and update.edited_channel_post:
+        chat = update.edited_channel_post.chat
+    if not chat and update.callback_query and update.callback_query.message:
+        chat = update.callback_query.message.chat
+    if not chat and update.chat_join_request:
+        chat = update.chat_join_request.chat
+    if not chat and update.chat_boost:
+        chat = update.chat_boost.chat
+    if not chat and update.removed_chat_boost:
+        chat = update.removed_chat_boost.chat
 
     if chat:
         msg = f"   >> Discovered {chat.type}: {getattr(chat, 'title', chat.username or chat.id)} (ID: {chat.id})"
         print(msg)
         log.info(msg)
-        _update_state_from_chat(state, chat)
+        _update_state_from_chat(chat, now_iso=now_iso)
     else:
         # Log update structure for debugging if no chat found
         print(f"   !! Update {update.update_id} contains no identifiable chat info. Fields: {list(update.to_dict().keys())}")
 
 
-EVENTS_FILE = pl.Path("data") / "telegram_events.json"
+# Events are an append-only JSON Lines log. The old JSON array form was
+# re-read and fully rewritten for every saved event (O(n) per append).
+EVENTS_FILE = pl.Path("data") / "telegram_events.jsonl"
 
 
 def _save_event(event_info: dict) -> None:
-    events = []
-    if EVENTS_FILE.exists():
-        with EVENTS_FILE.open("r", encoding="utf-8") as f:
-            try:
-                events = json.load(f)
-            except json.JSONDecodeError:
-                pass
-    
-    events.append(event_info)
-    
-    with EVENTS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if orjson:
+        line = orjson.dumps(event_info) + b"\n"
+        with EVENTS_FILE.open("ab") as f:
+            f.write(line)
+    else:
+        with EVENTS_FILE.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event_info, ensure_ascii=False) + "\n")
 
 
-def extract_event_info(text: str) -> dict | None:
-    if not text:
-        return None
+# Precompiled at module scope. extract_event_info runs for every update,
+# so we skip the re-cache lookup on each call.
+# Single alternation for Date (dd.mm.[yyyy]) and Time (HH:MM), so one pass
+# over the text covers both instead of two separate scans.
+_EVENT_RE = re.compile(r"(?P<d>\d{1,2})\.(?P<m>\d{1,2})\.(?P<y>\d{2,4})?|(?P<H>\d{1,2}):(?P<M>\d{2})")
 
-    # Regex for Date: dd.mm.yyyy or dd.mm.
-    date_pattern = r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})?"
-    # Regex for Time: HH:MM
-    time_pattern = r"(\d{1,2}):(\d{2})"
 
-    date_match = re.search(date_pattern, text)
-    time_match = re.search(time_pattern, text)
+def extract_event_info(text: str, now: dt.datetime | None = None) -> dict | None:
+    # Cheap pre-filter: a date like "11.03." needs at least 6 chars and a
+    # dot, so most group chatter never touches the regex engine.
+    if not text or len(text) < 6 or '.' not in text:
+        return None
+
+    # An announcement has its date near the top; cap the scan so long
+    # forwarded posts don't dominate per-message cost.
+    # First date and first time win, same as the old two-regex version.
+    date_match = None
+    time_match = None
+    for match in _EVENT_RE.finditer(text, 0, 512):
+        if match.group('d'):
+            if date_match is None:
+                date_match = match
+        elif time_match is None:
+            time_match = match
+        if date_match and time_match:
+            break
 
     if not date_match:
         return None
 
-    day = int(date_match.group(1))
-    month = int(date_match.group(2))
-    year_str = date_match.group(3)
+    day = int(date_match.group('d'))
+    month = int(date_match.group('m'))
+    year_str = date_match.group('y')
 
-    now = dt.datetime.now(TZ_BERLIN)
+    if now is None:
+        now = dt.datetime.now(TZ_BERLIN)
     year = int(year_str) if year_str else now.year
     
     # Adjust 2-digit year
@@ -220,8 +354,8 @@ def extract_event_info(text: str) -> dict | None:
     hour = 19
     minute = 0
     if time_match:
-        hour = int(time_match.group(1))
-        minute = int(time_match.group(2))
+        hour = int(time_match.group('H'))
+        minute = int(time_match.group('M'))
 
     return {
         "date": event_date.isoformat(),
@@ -284,29 +418,34 @@ async def handle_poll_answer(update: 'telegram.Update', context: 'txt.ContextTyp
 
 
 async def handle_any_message(update: 'telegram.Update', context: 'txt.ContextTypes.DEFAULT_TYPE') -> None:
-    state = _load_state()
-    _update_state_from_update(state, update)
-    _save_state(state)
-    
+    import telegram
+
+    # One notion of "now" per update, shared by last_seen and date parsing.
+    now = dt.datetime.now(TZ_BERLIN)
+    _update_state_from_update(update, now_iso=now.isoformat())
+
     msg = update.message or update.edited_message
     if not msg:
         return
 
-    text = msg.text or msg.caption or ""
-    
-    # 1. Pinned Message Detection
+    # Pinned and forwarded messages are mutually exclusive event
+    # candidates; one elif chain so only one branch is evaluated.
     if msg.pinned_message:
+        # 1. Pinned Message Detection
         print(f"Pinned message detected in {msg.chat.title}")
         text = msg.pinned_message.text or msg.pinned_message.caption or ""
-        # Process as event candidate
+    elif msg.chat.type == "private" and (msg.forward_origin or msg.forward_from or msg.forward_from_chat):
+        # 2. Forwarded Message Detection (in private chat)
+        print(f"Forwarded message detected from {msg.from_user.first_name}")
+        text = msg.text or msg.caption or ""
+    else:
+        text = msg.text or msg.caption or ""
 
-    # 2. Forwarded Message Detection (in private chat)
-    if msg.chat.type == "private" and (msg.forward_origin or msg.forward_from or msg.forward_from_chat):
-         print(f"Forwarded message detected from {msg.from_user.first_name}")
-         # Process as event candidate
+    # Attempt to extract event info (bot commands never contain events)
+    if text.startswith('/'):
+        return
 
-    # Attempt to extract event info
-    event_info = extract_event_info(text)
+    event_info = extract_event_info(text, now=now)
     if event_info:
         # Check if we should ignore (e.g. already processed, or bot's own poll msg - though unlikely here)
         print(f"Potential event found: {event_info}")
@@ -334,6 +473,19 @@ async def handle_any_message(update: 'telegram.Update', context: 'txt.ContextTyp
         await msg.reply_text(reply_text, reply_markup=telegram.InlineKeyboardMarkup(keyboard), parse_mode="HTML")
 
 
+# Per-chat locks: slow work in one chat must not block updates of other
+# chats, while updates within a chat keep their order.
+_CHAT_LOCKS: dict[int, asyncio.Lock] = {}
+
+
+async def dispatch_any_message(update: 'telegram.Update', context: 'txt.ContextTypes.DEFAULT_TYPE') -> None:
+    chat = update.effective_chat
+    chat_id = chat.id if chat else 0
+    lock = _CHAT_LOCKS.setdefault(chat_id, asyncio.Lock())
+    async with lock:
+        await handle_any_message(update, context)
+
+
 async def handle_callback(update: 'telegram.Update', context: 'txt.ContextTypes.DEFAULT_TYPE') -> None:
     query = update.callback_query
     await query.answer()
@@ -341,7 +493,9 @@ async def handle_callback(update: 'telegram.Update', context: 'txt.ContextTypes.
     if query.data == "confirm_event":
         event_info = context.user_data.get('pending_event')
         if event_info:
-            _save_event(event_info)
+            # Keep the read+rewrite of the events file off the event loop,
+            # so other chats' updates are not blocked on disk I/O.
+            await asyncio.to_thread(_save_event, event_info)
             await query.edit_message_text(text=f"✅ Termin am {event_info['date']} um {event_info['time']} wurde gespeichert!")
             print(f"Saved event: {event_info}")
         else:
@@ -367,8 +521,9 @@ def run_bot():
     termine_by_gid = _load_termine_by_gid()
 
     app = txt.Application.builder().token(BOT_TOKEN).build()
-    # Track all chats and groups
-    app.add_handler(txt.MessageHandler(txt.filters.ALL, handle_any_message), group=-1)
+    # Track all chats and groups. block=False lets chats be handled
+    # concurrently; dispatch_any_message serializes per chat.
+    app.add_handler(txt.MessageHandler(txt.filters.ALL, dispatch_any_message, block=False), group=-1)
 
 
     app.add_handler(txt.CommandHandler("create_poll", create_poll_command))
@@ -377,6 +532,13 @@ def run_bot():
 
     app.add_handler(txt.CommandHandler(["start", "help", "commands"], help_command))
 
+    # Re-read data/termine.json every few minutes, so a long-running
+    # bot picks up edits without a restart.
+    async def _refresh_termine_job(_ctx):
+        refresh_termine()
+
+    app.job_queue.run_repeating(_refresh_termine_job, interval=300, first=300)
+
     # Run the bot until the user presses Ctrl-C
     app.run_polling(allowed_updates=telegram.Update.ALL_TYPES)
 
@@ -386,16 +548,62 @@ _cli_defaults = {
 }
 
 
+_CLIENT: "telethon.TelegramClient" = None
+
+
 def init_telethon_client() -> "telethon.TelegramClient":
-    import telethon
-    # We use a bot session name to distinguish it from a user session if needed
-    client = telethon.TelegramClient('freiheitliche-stammtische-app', API_ID, API_HASH)
-    return client
+    global _CLIENT
+
+    if _CLIENT is None:
+        import telethon
+        # We use a bot session name to distinguish it from a user session if needed.
+        # receive_updates=False skips the update-catchup handshake; the
+        # register-chat/chat-info commands are read-only.
+        _CLIENT = telethon.TelegramClient(
+            'freiheitliche-stammtische-app', API_ID, API_HASH,
+            receive_updates=False,
+        )
+    return _CLIENT
 
 
-async def _resolve_entity(client: "telethon.TelegramClient", chat_id_str: str) -> "telethon.types.TypeEntity":
+def _peer_kind(entity) -> str | None:
     import telethon.types as ttypes
-    
+
+    if isinstance(entity, ttypes.User):
+        return "user"
+    if isinstance(entity, ttypes.Channel):
+        return "channel"
+    if isinstance(entity, ttypes.Chat):
+        return "chat"
+    return None
+
+
+async def _resolve_entity(
+    client: "telethon.TelegramClient",
+    chat_id_str: str,
+    peer_kind: str | None = None,
+) -> "telethon.types.TypeEntity":
+    import telethon.types as ttypes
+
+    # 0. A cached peer kind from a previous resolution skips the fallback
+    #    chain (up to 2 wasted RPCs per already-known chat).
+    if peer_kind:
+        try:
+            raw_id = int(chat_id_str)
+            if peer_kind == "channel":
+                channel_id = int(chat_id_str[4:]) if chat_id_str.startswith("-100") else abs(raw_id)
+                peer = ttypes.PeerChannel(channel_id)
+            elif peer_kind == "chat":
+                peer = ttypes.PeerChat(abs(raw_id))
+            else:
+                peer = ttypes.PeerUser(raw_id)
+
+            entity = await client.get_entity(peer)
+            if entity:
+                return entity
+        except Exception:
+            pass
+
     # 1. Try direct lookup (smartest)
     try:
         raw_id = int(chat_id_str)
@@ -437,10 +645,9 @@ async def _resolve_entity(client: "telethon.TelegramClient", chat_id_str: str) -
 
 async def register_chat_command(chat_id_str: str) -> None:
     from telethon import types
-    
-    state = _load_state()
+
     client = init_telethon_client()
-    
+
     # Telethon needs to be started with the BOT_TOKEN to act as a bot
     await client.start(bot_token=BOT_TOKEN)
     
@@ -476,19 +683,14 @@ async def register_chat_command(chat_id_str: str) -> None:
                 "username": getattr(entity, 'username', None),
                 "first_name": getattr(entity, 'first_name', None),
                 "last_name": getattr(entity, 'last_name', None),
-                "last_seen": dt.datetime.now(TZ_BERLIN).isoformat()
+                "last_seen": dt.datetime.now(TZ_BERLIN).isoformat(),
+                "peer_kind": _peer_kind(entity),
             }
 
-            if chat_type in ("group", "supergroup"):
-                state["groups"][chat_id_key] = info
-            elif chat_type == "channel":
-                state["channels"][chat_id_key] = info
-            else:
-                state["users"][chat_id_key] = info
+            _upsert_chat(info)
 
             print(f"Found {chat_type}: {info['title'] or info['username'] or chat_id_key}")
-            _save_state(state)
-            print(f"Successfully registered and saved to {STATE_FILE}")
+            print(f"Successfully registered and saved to {DB_FILE}")
             
             # Fetch recent messages (best effort)
             try:
@@ -500,7 +702,8 @@ async def register_chat_command(chat_id_str: str) -> None:
                     if message.sender:
                        sender = getattr(message.sender, 'title', getattr(message.sender, 'username', 'Unknown'))
                     
-                    text = (message.text or "[No text content]").replace('\n', ' ')[:80]
+                    # slice first, then replace — avoids copying the full body
+                    text = (message.text or "[No text content]")[:80].replace('\n', ' ')
                     print(f"  [{date_str}] {sender}: {text}...")
                     message_count += 1
                 
@@ -517,8 +720,8 @@ async def register_chat_command(chat_id_str: str) -> None:
 
 async def chat_info_command() -> None:
     from telethon import types
-    
-    state = _load_state()
+
+    state = _load_chats()
     client = init_telethon_client()
     
     # Start client as bot
@@ -527,7 +730,6 @@ async def chat_info_command() -> None:
     async with client:
         print("Refreshing info for all known chats...")
         
-        updated = False
         all_chats = []
         for category in ("users", "groups", "channels"):
             for chat_id, info in state.get(category, {}).items():
@@ -537,30 +739,40 @@ async def chat_info_command() -> None:
             print("No chats registered yet. Use register-chat --chat-id <id> first.")
             return
 
-        for category, chat_id_str, info in all_chats:
-            try:
-                entity = await _resolve_entity(client, chat_id_str)
-                if not entity:
-                    print(f"  [Error] Could not resolve {category[:-1]} {chat_id_str}")
-                    continue
-                
-                # Update info
-                info["title"] = getattr(entity, 'title', None)
-                info["username"] = getattr(entity, 'username', None)
-                info["first_name"] = getattr(entity, 'first_name', None)
-                info["last_name"] = getattr(entity, 'last_name', None)
-                info["last_seen"] = dt.datetime.now(TZ_BERLIN).isoformat()
-                
-                print(f"  [Refreshed] {category[:-1].capitalize()}: {info['title'] or info['username'] or chat_id_str}")
-                updated = True
-            except Exception as e:
-                print(f"  [Error] Could not refresh {category[:-1]} {chat_id_str}: {e}")
+        # Resolve concurrently (bounded), instead of one round-trip at a time.
+        sem = asyncio.Semaphore(8)
+
+        async def _bounded_resolve(chat_id_str: str, peer_kind: str | None):
+            async with sem:
+                return await _resolve_entity(client, chat_id_str, peer_kind=peer_kind)
+
+        tasks = [
+            asyncio.create_task(_bounded_resolve(chat_id_str, info.get("peer_kind")))
+            for _, chat_id_str, info in all_chats
+        ]
+        entities = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for (category, chat_id_str, info), entity in zip(all_chats, entities):
+            if isinstance(entity, BaseException):
+                print(f"  [Error] Could not refresh {category[:-1]} {chat_id_str}: {entity}")
+                continue
+            if not entity:
+                print(f"  [Error] Could not resolve {category[:-1]} {chat_id_str}")
+                continue
+
+            # Update info
+            info["title"] = getattr(entity, 'title', None)
+            info["username"] = getattr(entity, 'username', None)
+            info["first_name"] = getattr(entity, 'first_name', None)
+            info["last_name"] = getattr(entity, 'last_name', None)
+            info["last_seen"] = dt.datetime.now(TZ_BERLIN).isoformat()
+            info["peer_kind"] = _peer_kind(entity)
+            _upsert_chat(info)
+
+            print(f"  [Refreshed] {category[:-1].capitalize()}: {info['title'] or info['username'] or chat_id_str}")
 
-        if updated:
-            _save_state(state)
-        
         print("\n--- Current State ---")
-        print(json.dumps(state, indent=2, ensure_ascii=False))
+        print(json.dumps(_load_chats(), indent=2, ensure_ascii=False))
 
 
 def main(argv: list[str] = sys.argv[1:]) -> int:
@@ -579,12 +791,10 @@ def main(argv: list[str] = sys.argv[1:]) -> int:
             print("Error: --chat-id is required for register-chat")
             return 1
         
-        import asyncio
         asyncio.run(register_chat_command(chat_id))
         return 0
 
     if subcmd == "chat-info":
-        import asyncio
         asyncio.run(chat_info_command())
         return 0
 
@@ -5,8 +5,9 @@
 #   "pudb", "ipython",
 #   "pillow>=11.1.0",
 #   "telethon>=1.42.0",
-#   "python-telegram-bot>=22.5",
+#   "python-telegram-bot[job-queue]>=22.5",
 #   "python-dateutil",
+#   "orjson",
 # ]
 # ///
 """
@@ -45,12 +46,18 @@ import json
 import uuid
 import asyncio
 import logging
+import sqlite3
 import pathlib as pl
 import datetime as dt
 import zoneinfo as zi
 
 from lib import cli
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # NOTE: we use lazy import to import these modules
 #   telegram, telethon
 
@@ -66,28 +73,154 @@ FSTISCH_APP_TITLE = os.environ.get('FSTISCH_APP_TITLE', 'freiheitliche-stammtisc
 
 
 STATE_FILE = pl.Path("data") / "telegram_bot.json"
+DB_FILE = pl.Path("data") / "telegram_bot_v2.sqlite"
+
+# Regex for Date: dd.mm.yyyy or dd.mm. or yyyy-mm-dd
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})|(\d{1,2})\.(\d{1,2})\.(\d{2,4})?")
+# Regex for Time: HH:MM or "19 Uhr" (one alternation, shared boundaries)
+_TIME_RE = re.compile(r"\b(?:(\d{1,2}):(\d{2})|(\d{1,2})\s{0,2}Uhr)\b")
+# Regex for PLZ (5 digits)
+_PLZ_RE = re.compile(r"\b(\d{5})\b")
+_LABEL_RE = re.compile(r'^(Event|Treffen|Stammtisch|Nächstes Treffen):\s*', flags=re.IGNORECASE)
+# one pass over the whole text instead of .lower() + substring checks per line
+_LABEL_SCAN_RE = re.compile(r"stammtisch|event:|treffen:", flags=re.IGNORECASE)
+
+
+# parsed state, reused as long as the file on disk is unchanged
+_STATE_CACHE: dict = {"mtime": 0, "data": None}
 
 
 def _load_state(path: pl.Path) -> dict:
     if not path.exists():
         return {}
 
-    with path.open(mode="r", encoding="utf-8") as fobj:
-        try:
-            return json.load(fobj)
-        except json.JSONDecodeError:
-            return {}
+    mtime = path.stat().st_mtime_ns
+    if _STATE_CACHE["data"] is not None and _STATE_CACHE["mtime"] == mtime:
+        return _STATE_CACHE["data"]
+
+    data = path.read_bytes()
+    try:
+        state = orjson.loads(data) if orjson else json.loads(data)
+    except ValueError:
+        state = {}
+
+    _STATE_CACHE["mtime"] = mtime
+    _STATE_CACHE["data"] = state
+    return state
 
 
 def _save_state(state: dict, path: pl.Path) -> None:
-    state_text = cli.json_dumps_pretty(state)
+    if orjson:
+        state_data = orjson.dumps(
+            state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        state_data = cli.json_dumps_pretty(state).encode("utf-8")
 
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_suffix(f".tmp-{uuid.uuid4().hex}")
-    with temp_path.open(mode="w", encoding="utf-8") as fobj:
-        fobj.write(state_text)
+    with temp_path.open(mode="wb") as fobj:
+        fobj.write(state_data)
+        fobj.flush()
+        os.fsync(fobj.fileno())
     temp_path.replace(path)
 
+    # fsync the directory so the rename itself survives a crash
+    dir_fd = os.open(path.parent, os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+    _STATE_CACHE["mtime"] = path.stat().st_mtime_ns
+    _STATE_CACHE["data"] = state
+
+
+# history and events live in sqlite so each new message/event is one
+# O(row) insert instead of a full rewrite of the json state file
+
+_DB_CONN: sqlite3.Connection | None = None
+
+
+def _db() -> sqlite3.Connection:
+    global _DB_CONN
+
+    if _DB_CONN is None:
+        DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_FILE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                chat_id     INTEGER,
+                msg_id      INTEGER,
+                date        TEXT,
+                sender_id   INTEGER,
+                sender_name TEXT,
+                text        TEXT,
+                extra       TEXT,
+                PRIMARY KEY (chat_id, msg_id)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                chat_id INTEGER,
+                beginn  TEXT,
+                name    TEXT,
+                uhrzeit TEXT,
+                plz     TEXT,
+                PRIMARY KEY (chat_id, beginn, name)
+            )
+            """
+        )
+        conn.commit()
+        _migrate_legacy_state(conn)
+        _DB_CONN = conn
+
+    return _DB_CONN
+
+
+def _migrate_legacy_state(conn: sqlite3.Connection) -> None:
+    """One-time import of pre-sqlite history/events from the json state.
+
+    Dropping the migrated blobs keeps data/telegram_bot.json down to the
+    chat registry, so loading it stays O(num chats).
+    """
+    state = _load_state(path=STATE_FILE)
+    if not ("history" in state or "events" in state):
+        return
+
+    for cid, records in state.pop("history", {}).items():
+        for rec in records:
+            extra = {k: rec[k] for k in ("topic_id", "event", "poll") if k in rec}
+            conn.execute(
+                "INSERT OR IGNORE INTO messages"
+                " (chat_id, msg_id, date, sender_id, sender_name, text, extra)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    int(cid),
+                    rec["id"],
+                    rec["date"],
+                    rec.get("sender_id"),
+                    rec.get("sender_name"),
+                    rec.get("text"),
+                    json.dumps(extra, ensure_ascii=False) if extra else None,
+                ),
+            )
+
+    for cid, events in state.pop("events", {}).items():
+        for event_info in events:
+            conn.execute(
+                "INSERT OR IGNORE INTO events (chat_id, beginn, name, uhrzeit, plz) VALUES (?, ?, ?, ?, ?)",
+                (int(cid), event_info['beginn'], event_info['name'], event_info['uhrzeit'], event_info.get('plz')),
+            )
+
+    conn.commit()
+    _save_state(state, path=STATE_FILE)
+
 
 # helpers implementing lazy imports
 
@@ -106,10 +239,22 @@ def init_telethon_client() -> "telethon.TelegramClient":
 def _load_known_chat_ids() -> list[int]:
     """Load known chat IDs from data/telegram_bot.json"""
     state = _load_state(path=STATE_FILE)
-    return list(state['chats'].keys())
+    return list(state.get('chats', {}).keys())
+
+
+_ENTITY_CACHE: dict[str, "telethon.types.TypeEntity"] = {}
 
 
 async def _resolve_entity(client: "telethon.TelegramClient", chat_id_str: str) -> "telethon.types.TypeEntity":
+    entity = _ENTITY_CACHE.get(chat_id_str)
+    if entity is None:
+        entity = await _resolve_entity_uncached(client, chat_id_str)
+        if entity is not None:
+            _ENTITY_CACHE[chat_id_str] = entity
+    return entity
+
+
+async def _resolve_entity_uncached(client: "telethon.TelegramClient", chat_id_str: str) -> "telethon.types.TypeEntity":
     # 1. Try direct lookup (smartest)
     try:
         raw_id = int(chat_id_str)
@@ -151,8 +296,10 @@ async def _resolve_entity(client: "telethon.TelegramClient", chat_id_str: str) -
 
 
 def _parse_poll(msg) -> dict | None:
+    from telethon.tl.types import MessageMediaPoll
+
     media = msg.media
-    if not (media and hasattr(media, 'poll') and hasattr(media.poll, 'question')):
+    if not isinstance(media, MessageMediaPoll):
         return None
 
     poll = media.poll
@@ -196,21 +343,15 @@ def parse_event_info(text: str) -> dict | None:
     if not text:
         return None
 
-    # Regex for Date: dd.mm.yyyy or dd.mm. or yyyy-mm-dd
-    date_pattern = r"(\d{4}-\d{2}-\d{2})|(\d{1,2})\.(\d{1,2})\.(\d{2,4})?"
-    # Regex for Time: HH:MM or "19 Uhr"
-    time_pattern = r"\b((\d{1,2}):(\d{2}))\b|\b(\d{1,2})\s{0,2}Uhr\b"
-    # Regex for PLZ (5 digits)
-    plz_pattern = r"\b(\d{5})\b"
-
-    date_match = re.search(date_pattern, text)
-    time_match = re.search(time_pattern, text)
-    plz_match = re.search(plz_pattern, text)
-
     # If no date, it's probably not an event we can easily process
+    # (checked first so most messages are scanned only once)
+    date_match = _DATE_RE.search(text)
     if not date_match:
         return None
 
+    time_match = _TIME_RE.search(text)
+    plz_match = _PLZ_RE.search(text)
+
     day, month, year = None, None, None
     if date_match.group(1):
         # yyyy-mm-dd
@@ -221,17 +362,15 @@ def parse_event_info(text: str) -> dict | None:
         month = int(date_match.group(3))
         year_str = date_match.group(4)
         
-        now = dt.datetime.now(TZ_BERLIN)
-        year = int(year_str) if year_str else now.year
+        today = dt.datetime.now(TZ_BERLIN).date()
+        year = int(year_str) if year_str else today.year
         if year < 100:
             year += 2000
-        
+
         # Adjust next year if date is in the past
-        try:
-            if not year_str and dt.date(year, month, day) < now.date():
-                year += 1
-        except ValueError:
-            pass
+        # (tuple compare; invalid day/month is caught by dt.date below)
+        if not year_str and (year, month, day) < (today.year, today.month, today.day):
+            year += 1
 
     try:
         event_date = dt.date(year, month, day)
@@ -242,22 +381,26 @@ def parse_event_info(text: str) -> dict | None:
     time_str = "19:00" # Default
     if time_match:
         if time_match.group(1): # HH:MM
-            time_str = time_match.group(1)
-        elif time_match.group(4): # X Uhr
-            time_str = f"{int(time_match.group(4)):02d}:00"
+            time_str = f"{time_match.group(1)}:{time_match.group(2)}"
+        elif time_match.group(3): # X Uhr
+            time_str = f"{int(time_match.group(3)):02d}:00"
 
     # Name extraction: Try to find "Stammtisch" or "Event" or first line
-    lines = [L.strip() for L in text.split('\n') if L.strip()]
     name = "Unbekanntes Event"
-    for line in lines:
-        if "stammtisch" in line.lower() or "event:" in line.lower() or "treffen:" in line.lower():
-            # Clean up labels
-            clean_line = re.sub(r'^(Event|Treffen|Stammtisch|Nächstes Treffen):\s*', '', line, flags=re.IGNORECASE)
-            name = clean_line.strip()
-            break
+    label_match = _LABEL_SCAN_RE.search(text)
+    if label_match:
+        # take the line containing the earliest label hit
+        line_start = text.rfind('\n', 0, label_match.start()) + 1
+        line_end = text.find('\n', label_match.end())
+        if line_end == -1:
+            line_end = len(text)
+        line = text[line_start:line_end]
+        name = _LABEL_RE.sub('', line.strip()).strip()
     else:
-        if lines:
-            name = lines[0]
+        for line in text.split('\n'):
+            if line.strip():
+                name = line.strip()
+                break
 
     return {
         "name": name,
@@ -268,38 +411,20 @@ def parse_event_info(text: str) -> dict | None:
 
 
 def _save_event(chat_id: str, event_info: dict) -> None:
-    state = _load_state(path=STATE_FILE)
-    if 'events' not in state:
-        state['events'] = {}
-    if chat_id not in state['events']:
-        state['events'][chat_id] = []
-
-    # Check for duplicates (same date and name)
-    events = state['events'][chat_id]
-    for existing in events:
-        if existing.get('beginn') == event_info['beginn'] and existing.get('name') == event_info['name']:
-            log.info(f"Event already exists: {event_info['name']} on {event_info['beginn']}")
-            return
-
-    events.append(event_info)
-    events.sort(key=lambda x: x['beginn'])
-    state['events'][chat_id] = events
-    
-    _save_state(state, path=STATE_FILE)
-
-
-def _iter_records(recent_msgs, history_map):
-    for msg in reversed(recent_msgs):
-        if msg.text and "Limburg" in msg.text:
-            print("######################")
-            print(getattr(msg, 'reply_to_top_id', None))
-            print(getattr(msg.reply_to, 'reply_to_top_id', None))
-            print("######################")
-            breakpoint()
-
-        if msg.id in history_map:
-            continue
-
+    db = _db()
+    cursor = db.execute(
+        "INSERT OR IGNORE INTO events (chat_id, beginn, name, uhrzeit, plz) VALUES (?, ?, ?, ?, ?)",
+        (int(chat_id), event_info['beginn'], event_info['name'], event_info['uhrzeit'], event_info['plz']),
+    )
+    db.commit()
+    if cursor.rowcount == 0:
+        log.info(f"Event already exists: {event_info['name']} on {event_info['beginn']}")
+
+
+def _iter_records(recent_msgs):
+    # insert order no longer matters (sqlite keys on chat_id/msg_id),
+    # so no need to reverse into chronological order first
+    for msg in recent_msgs:
         if not (msg.text or msg.media):
             continue
 
@@ -332,6 +457,27 @@ def _iter_records(recent_msgs, history_map):
         yield record
 
 
+async def _fetch_chat_history(
+    client: "telethon.TelegramClient", chat_id: int, min_id: int, sem: asyncio.Semaphore
+) -> tuple[str | None, list]:
+    async with sem:
+        # Resolve entity using robust helper
+        entity = await _resolve_entity(client, str(chat_id))
+        if not entity:
+            log.warning(f"Could not resolve entity for ID: {chat_id}")
+            return None, []
+
+        chat_title = getattr(entity, 'title', getattr(entity, 'username', str(chat_id)))
+
+        # min_id makes telegram return only messages newer than what we
+        # already have; at steady-state most chats return nothing
+        recent_msgs = []
+        async for msg in client.iter_messages(entity, min_id=min_id, limit=200):
+            recent_msgs.append(msg)
+
+        return chat_title, recent_msgs
+
+
 async def print_recent_chat_messages(chat_ids: list[int] | None = None) -> None:
     if chat_ids is None:
         chat_ids = _load_known_chat_ids()
@@ -342,50 +488,56 @@ async def print_recent_chat_messages(chat_ids: list[int] | None = None) -> None:
 
     log.info(f"Fetching recent messages for {len(chat_ids)} chats via Telethon...")
 
-    # Update state with fetched history
-    state = _load_state(path=STATE_FILE)
-    if "history" not in state:
-        state["history"] = {}
-
+    db = _db()
     client = init_telethon_client()
 
     try:
         async with client:
+            # overlap the per-chat network round-trips
+            sem = asyncio.Semaphore(5)
+            tasks = []
             for chat_id in chat_ids:
-                existing_history = state["history"].get(str(chat_id), [])
-                history_map = {msg["id"]: msg for msg in existing_history}
+                row = db.execute(
+                    "SELECT COALESCE(MAX(msg_id), 0) FROM messages WHERE chat_id = ?", (int(chat_id),)
+                ).fetchone()
+                tasks.append(_fetch_chat_history(client, chat_id, row[0], sem))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for chat_id, result in zip(chat_ids, results):
+            if isinstance(result, BaseException):
+                log.warning(f"Could not fetch history for {chat_id}: {result}")
+                continue
 
-                try:
-                    # Resolve entity using robust helper
-                    entity = await _resolve_entity(client, str(chat_id))
-                    if not entity:
-                        log.warning(f"Could not resolve entity for ID: {chat_id}")
-                        continue
-
-                    chat_title = getattr(entity, 'title', getattr(entity, 'username', str(chat_id)))
-
-                    # Fetch last 10 messages
-                    recent_msgs = []
-                    async for msg in client.iter_messages(entity, limit=50):
-                        recent_msgs.append(msg)
-                    
-                    new_records = list(_iter_records(recent_msgs, history_map))
-                    if recent_msgs:
-                        log.info(f"--- {len(new_records):>2} new messages in {chat_id:>11} - {chat_title} ---")
-                    else:
-                        log.info(f"--- No new messages in {chat_id:>11} - {chat_title} ---")
-                        continue
+            chat_title, recent_msgs = result
+            if chat_title is None:
+                continue
 
-                    for record in new_records:
-                        log.info(f"  [{record['date']}] {record['sender_name']}: {repr(record['text'])[:120]}")
-                        history_map[record["id"]] = record
+            cid = int(chat_id)
+            new_records = list(_iter_records(recent_msgs))
+            if recent_msgs:
+                log.info(f"--- {len(new_records):>2} new messages in {chat_id:>11} - {chat_title} ---")
+            else:
+                log.info(f"--- No new messages in {chat_id:>11} - {chat_title} ---")
+                continue
 
-                    state["history"][str(chat_id)] = sorted(history_map.values(), key=lambda x: x["date"])
-                    _save_state(state, path=STATE_FILE)
-                    
-                except Exception as ex:
-                    log.warning(f"Could not fetch history for {chat_id}: {ex}")
-                    raise
+            for record in new_records:
+                log.info(f"  [{record['date']}] {record['sender_name']}: {repr(record['text'])[:120]}")
+                extra = {k: record[k] for k in ("topic_id", "event", "poll") if k in record}
+                db.execute(
+                    "INSERT OR IGNORE INTO messages"
+                    " (chat_id, msg_id, date, sender_id, sender_name, text, extra)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        cid,
+                        record["id"],
+                        record["date"],
+                        record["sender_id"],
+                        record["sender_name"],
+                        record["text"],
+                        json.dumps(extra, ensure_ascii=False) if extra else None,
+                    ),
+                )
+        db.commit()
     except Exception as ex:
         log.error(f"Failed to fetch history session: {ex}")
         raise
@@ -471,16 +623,17 @@ async def handle_callback(update: 'telegram.Update', context: 'tgext.ContextType
         await query.edit_message_text(text="❌ Vorgang abgebrochen.")
 
 
-def listen_command(args) -> None:
-    import telegram
-    import telegram.ext as tgext
-
-    # Fetch history first (blocking the start of polling, which is fine for startup)
+async def _history_job(context: 'tgext.ContextTypes.DEFAULT_TYPE') -> None:
     try:
-        asyncio.run(print_recent_chat_messages())
+        await print_recent_chat_messages()
     except Exception as ex:
         log.error(f"Error during history fetch: {ex}")
 
+
+def listen_command(args) -> None:
+    import telegram
+    import telegram.ext as tgext
+
     log.info("Starting bot polling...")
 
     # Build the application
@@ -488,10 +641,15 @@ def listen_command(args) -> None:
 
     # Add handler to listen to ALL updates
     application.add_handler(tgext.MessageHandler(tgext.filters.ALL, listen_any), group=0)
-    
+
     # Add callback handler for event confirmation
     application.add_handler(tgext.CallbackQueryHandler(handle_callback))
 
+    # Fetch history in the background so the bot answers immediately,
+    # then incrementally every few minutes (min_id keeps fetches cheap).
+    application.job_queue.run_once(_history_job, when=1)
+    application.job_queue.run_repeating(_history_job, interval=300, first=300)
+
     # Run the bot
     application.run_polling(allowed_updates=telegram.Update.ALL_TYPES)
 
@@ -5,7 +5,7 @@
 #   "pudb", "ipython",
 #   "pillow>=11.1.0",
 #   "telethon>=1.42.0",
-#   "python-telegram-bot>=22.5",
+#   "python-telegram-bot[job-queue]>=22.5",
 #   "python-dateutil",
 #   "google-api-python-client~=2.188.0",
 #   "google-auth~=2.38.0",
@@ -24,14 +24,21 @@ Usage:
 Options:
     -h, --help                  Show this help message and exit
     --sheet-id <id>             Google Sheet ID
+    --skip-catchup              Skip the telethon catch-up at startup
     -v, --verbose               Enable verbose logging
 """
 
 import os
 import re
 import sys
+import enum
+import time
+import heapq
 import asyncio
 import logging
+import collections
+import functools as ft
+import concurrent.futures
 import pathlib as pl
 import datetime as dt
 import zoneinfo as zi
@@ -62,6 +69,36 @@ ADMIN_IDS = {
     "1473328156",   # Lukas
 }
 
+# patterns used on every message in the create-event flow
+_DATE_SHORT_RE = re.compile(r"(\d{1,2})\.(\d{1,2})")
+_TIME_LOOSE_RE = re.compile(r"(\d{1,2})[:.](\d{2})|\b(\d{1,2})\s*Uhr")
+_PLZ_RE = re.compile(r"\b(\d{5})\b")
+_MIGRATION_RE = re.compile(r"New chat id: (-?\d+)")
+
+# static keyboards, instantiated once instead of per message
+_MAIN_KB_ROWS = [['Bot Info', 'Meine Termine'], ['Termin Erstellen', 'Termin Löschen']]
+MAIN_KB = ReplyKeyboardMarkup(_MAIN_KB_ROWS, resize_keyboard=True)
+ADMIN_KB = ReplyKeyboardMarkup(
+    _MAIN_KB_ROWS + [['Nutzer Aktivieren', 'Nutzer Deaktivieren']], resize_keyboard=True
+)
+CANCEL_KB = ReplyKeyboardMarkup([['Abbrechen']], resize_keyboard=True)
+YES_CANCEL_KB = ReplyKeyboardMarkup([['Abbrechen', 'Ja']], resize_keyboard=True, one_time_keyboard=True)
+
+
+class Step(enum.IntEnum):
+    """Steps of the create-event flow (see handle_create_event)."""
+    ASK_NAME = 1
+    ASK_DATE = 2
+    CONFIRM_DATE = 3
+    ASK_TIME = 4
+    ASK_PLZ = 5
+    CONFIRM_SAVE = 6
+
+
+# Reads of the termine sheet take seconds and count against the GSheet
+# quota, so interactive commands reuse a short-lived cache.
+TERMINE_CACHE_TTL = 60
+
 
 class BotState:
     def __init__(self, sheet_id: str):
@@ -69,18 +106,79 @@ class BotState:
         self.users = {}  # telegram_id -> user_data
         self.last_sync = None
         self.start_time = dt.datetime.now(TZ_BERLIN)
+        self._termine_cache: list[dict] = []
+        self._termine_by_plz: dict[str, list[tuple[int, dict]]] = {}
+        self._termine_cache_ts = 0.0
+        # Sheets I/O gets its own small pool so slow reads can't starve
+        # the default executor, and a per-sheet lock serializes mutations.
+        self._sheet_exec = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="gsheet")
+        self._sheet_locks: dict[str, asyncio.Lock] = collections.defaultdict(asyncio.Lock)
+
+    async def call_sheet(self, sheet_name: str, fn, *args, **kwargs):
+        async with self._sheet_locks[sheet_name]:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._sheet_exec, ft.partial(fn, *args, **kwargs))
+
+    async def get_termine(self, force: bool = False) -> list[dict]:
+        cache_age = time.monotonic() - self._termine_cache_ts
+        if not force and self._termine_cache and cache_age < TERMINE_CACHE_TTL:
+            return self._termine_cache
+
+        rows = await self.call_sheet("termine", self.sheet.read, "termine")
+        self._set_termine(rows)
+        return rows
+
+    def _set_termine(self, rows: list[dict]) -> None:
+        by_plz: dict[str, list[tuple[int, dict]]] = {}
+        for i, termin in enumerate(rows):
+            # interned so membership tests against _plz_set hit pointer equality
+            plz = sys.intern(str(termin.get('plz', '')).strip())
+            # i + 2: sheet row index of the first data row
+            by_plz.setdefault(plz, []).append((i + 2, termin))
+
+        self._termine_cache = rows
+        self._termine_by_plz = by_plz
+        self._termine_cache_ts = time.monotonic()
+
+    async def get_termine_by_plz(self, user_plz: set[str], force: bool = False) -> list[tuple[int, dict]]:
+        """Rows matching any of the given PLZ, as (sheet_row_idx, termin)."""
+        await self.get_termine(force=force)
+        candidates: list[tuple[int, dict]] = []
+        for plz in user_plz:
+            if plz:
+                candidates.extend(self._termine_by_plz.get(plz, ()))
+        return candidates
+
+    def invalidate_termine(self) -> None:
+        self._termine_cache_ts = 0.0
 
     def sync_users(self):
         log.info("Syncing users from GSheet...")
         rows = self.sheet.read("kontakte")
+        self._set_users(rows)
+        log.info(f"Synced {len(self.users)} users.")
+
+    def _set_users(self, rows: list[dict]) -> None:
         new_users = {}
         for row in rows:
             tg_id = row.get("telegram_id")
             if tg_id:
+                # hoist per-message string work out of the handlers
+                row["_bot_modus_norm"] = row.get("bot_modus", "").lower()
+                row["_plz_set"] = frozenset(
+                    sys.intern(plz.strip()) for plz in row.get("plz", "").split(",") if plz.strip()
+                )
                 new_users[str(tg_id)] = row
         self.users = new_users
         self.last_sync = dt.datetime.now(TZ_BERLIN)
-        log.info(f"Synced {len(self.users)} users.")
+
+    def sync_all(self):
+        """Refreshes kontakte and termine with one batchGet request."""
+        log.info("Syncing users and termine from GSheet...")
+        data = self.sheet.batch_read(["kontakte", "termine"])
+        self._set_users(data["kontakte"])
+        self._set_termine(data["termine"])
+        log.info(f"Synced {len(self.users)} users and {len(data['termine'])} termine.")
 
     def is_user_active(self, tg_id: str | int) -> tuple[bool, str | None]:
         tg_id = str(tg_id)
@@ -92,7 +190,7 @@ class BotState:
             return False, "Unknown"
         
         # normalized key for "Bot Modus" is "bot_modus"
-        modus = user.get("bot_modus", "").lower()
+        modus = user.get("_bot_modus_norm", "")
         if modus == "aktiv":
             return True, "Aktiv"
         return False, user.get("bot_modus", "Inaktiv")
@@ -120,6 +218,36 @@ async def git_sync_and_push(sheet_id: str, message: str):
         # Note: We don't notify the user here as it's a background operation
 
 
+# Rapid edits should result in one sync+push, both to save the full
+# sync round trips and to keep concurrent pushes from racing each other.
+GIT_PUSH_DEBOUNCE = 20.0
+
+_GIT_PUSH_TASK: asyncio.Task | None = None
+_GIT_PUSH_MESSAGES: list[str] = []
+
+
+def schedule_git_sync_and_push(sheet_id: str, message: str) -> None:
+    """Coalesces edits within GIT_PUSH_DEBOUNCE seconds into one push.
+
+    The worker drains the pending messages and is never cancelled, so
+    an edit arriving mid-push can't interrupt the sync/commit/push
+    sequence; it just queues up for the next round.
+    """
+    global _GIT_PUSH_TASK
+
+    _GIT_PUSH_MESSAGES.append(message)
+    if _GIT_PUSH_TASK is None or _GIT_PUSH_TASK.done():
+        _GIT_PUSH_TASK = asyncio.create_task(_git_push_worker(sheet_id))
+
+
+async def _git_push_worker(sheet_id: str) -> None:
+    while _GIT_PUSH_MESSAGES:
+        await asyncio.sleep(GIT_PUSH_DEBOUNCE)
+        combined = ", ".join(_GIT_PUSH_MESSAGES)
+        _GIT_PUSH_MESSAGES.clear()
+        await git_sync_and_push(sheet_id, combined)
+
+
 async def announce_event(bot, event: dict):
     tg_target = event.get('telegram_group_id')
     if not tg_target:
@@ -150,7 +278,7 @@ async def announce_event(bot, event: dict):
         wd = util.get_weekday_de(date_str)
         try:
            d = dt.date.fromisoformat(date_str)
-           date_display = d.strftime("%d.%m.%Y")
+           date_display = f"{d.day:02d}.{d.month:02d}.{d.year}"
         except:
            date_display = date_str
 
@@ -181,7 +309,7 @@ async def announce_event(bot, event: dict):
             except Exception as e:
                 log.warning(f"Failed to send to {cid}: {e}")
                 # Check for "Group migrated to supergroup. New chat id: <id>"
-                migration_match = re.search(r"New chat id: (-?\d+)", str(e))
+                migration_match = _MIGRATION_RE.search(str(e))
                 if migration_match:
                     new_chat_id = int(migration_match.group(1))
                     log.info(f"Detected group migration. Retrying with new chat id: {new_chat_id}")
@@ -240,17 +368,10 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     is_active, status = bot_state.is_user_active(user_id)
     
     if is_active:
-        keyboard = [['Bot Info', 'Meine Termine'], ['Termin Erstellen', 'Termin Löschen']]
-        
-        if user_id in ADMIN_IDS:
-            keyboard.append(['Nutzer Aktivieren', 'Nutzer Deaktivieren'])
-
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-
         await update.message.reply_text(
             WELCOME_MESSAGE +
             "Wie kann ich Ihnen helfen?",
-            reply_markup=reply_markup
+            reply_markup=get_main_keyboard(user_id)
         )
     elif status == "Unknown":
         log.warning(f"Unauthorized access attempt from {user_id} (@{update.effective_user.username})")
@@ -313,9 +434,8 @@ async def list_my_events(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = str(update.effective_user.id)
     bot_state: BotState = context.bot_data['state']
     user_data = bot_state.users.get(user_id)
-    user_plz_raw = user_data.get("plz", "")
-    user_plz = {plz.strip() for plz in user_plz_raw.split(",")}
-    
+    user_plz = user_data.get("_plz_set", frozenset())
+
     if not user_plz:
         await update.message.reply_text("In deinem Kontakt-Profil ist keine PLZ hinterlegt.")
         return
@@ -326,15 +446,10 @@ async def list_my_events(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
     status_msg = await update.message.reply_text("🔍 Suche Termine...")
 
-    termine = await asyncio.to_thread(bot_state.sheet.read, "termine")
+    # Some PLZ might be strings or ints in GSheet; the index normalizes them.
+    matches = [termin for _, termin in await bot_state.get_termine_by_plz(user_plz)]
+
 
-    # Filter by PLZ. Some PLZ might be strings or ints in GSheet.
-    matches = []
-    for termin in termine:
-        plz = termin.get('plz')
-        if plz and plz in user_plz:
-            matches.append(termin)
-    
     if not matches:
         await status_msg.edit_text(f"Keine Termine für PLZ {user_plz} gefunden.")
         return
@@ -353,7 +468,7 @@ async def list_my_events(update: Update, context: ContextTypes.DEFAULT_TYPE):
         if date_str != "Unbekannt":
             try:
                 d = dt.date.fromisoformat(date_str)
-                date_display = d.strftime("%d.%m.%Y")
+                date_display = f"{d.day:02d}.{d.month:02d}.{d.year}"
             except: pass
 
         msg += f"📅 {wd} {date_display} {time}\n📍 {name}\n\n"
@@ -361,12 +476,8 @@ async def list_my_events(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(msg)
 
 
-def get_main_keyboard(user_id: str):
-    keyboard = [['Bot Info', 'Meine Termine'], ['Termin Erstellen', 'Termin Löschen']]
-    if user_id in ADMIN_IDS:
-        keyboard.append(['Nutzer Aktivieren', 'Nutzer Deaktivieren'])
-
-    return ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+def get_main_keyboard(user_id: str) -> ReplyKeyboardMarkup:
+    return ADMIN_KB if user_id in ADMIN_IDS else MAIN_KB
 
 
 async def handle_create_event(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -377,6 +488,10 @@ async def handle_create_event(update: Update, context: ContextTypes.DEFAULT_TYPE
     current_state = context.user_data.get('state')
     text = (update.message.text if update.message else "").strip()
 
+    # most prompts use one of two static keyboards, bind them once
+    send_cancel = ft.partial(update.message.reply_text, reply_markup=CANCEL_KB)
+    send_yn = ft.partial(update.message.reply_text, reply_markup=YES_CANCEL_KB)
+
     async def reset_flow(msg: str):
         context.user_data['state'] = None
         context.user_data['flow_step'] = None
@@ -391,222 +506,187 @@ async def handle_create_event(update: Update, context: ContextTypes.DEFAULT_TYPE
     if current_state != 'awaiting_event_info':
         # --- Start Flow: Fetch previous event for defaults ---
         context.user_data['state'] = 'awaiting_event_info'
-        context.user_data['flow_step'] = 'ask_name'
+        context.user_data['flow_step'] = Step.ASK_NAME
         context.user_data['new_event'] = {}
         
         # Find the most recent event by this user's PLZ
-        user_plz_raw = user_data.get("plz", "")
-        user_plz = {plz.strip() for plz in user_plz_raw.split(",") if plz.strip()}
-        
+        user_plz = user_data.get("_plz_set", frozenset())
+
         log.info(f"Searching previous events for user {user_id} with PLZ {user_plz}")
-        termine = await asyncio.to_thread(bot_state.sheet.read, "termine")
-        user_events = []
-        for t in termine:
-            t_plz = str(t.get('plz', '')).strip()
-            if t_plz in user_plz:
-                user_events.append(t)
-        
-        # Sort by date (descending)
-        prev_event = None
-        if user_events:
-            try:
-                # 'beginn' is ISO format yyyy-mm-dd
-                user_events.sort(key=lambda t: t.get('beginn', ''), reverse=True)
-                prev_event = user_events[0]
-            except Exception as e:
-                log.warning(f"Error sorting previous events: {e}")
+        user_events = [t for _, t in await bot_state.get_termine_by_plz(user_plz)]
+
+        # 'beginn' is ISO format yyyy-mm-dd, so max() by string is the most recent
+        prev_event = max(user_events, key=lambda t: t.get('beginn', ''), default=None)
 
         if prev_event:
             context.user_data['prev_event'] = prev_event
             prev_name = prev_event.get('name', 'Stammtisch')
-            keyboard = [['Abbrechen', 'Ja']]
-            reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-            await update.message.reply_text(
-                f'Soll der Stammtisch weiterhin "{prev_name}" heißen?',
-                reply_markup=reply_markup
-            )
+            await send_yn(f'Soll der Stammtisch weiterhin "{prev_name}" heißen?')
         else:
             context.user_data['prev_event'] = {}
-            keyboard = [['Abbrechen']]
-            reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-            await update.message.reply_text("Wie soll der Stammtisch heißen?", reply_markup=reply_markup)
+            await send_cancel("Wie soll der Stammtisch heißen?")
         return
 
     flow_step = context.user_data.get('flow_step')
     prev_event = context.user_data.get('prev_event', {})
     new_event = context.user_data.get('new_event', {})
 
-    if flow_step == 'ask_name':
-        if text.lower() == 'ja':
-            new_event['name'] = prev_event.get('name', 'Stammtisch')
-        else:
-            new_event['name'] = text
-        
-        context.user_data['flow_step'] = 'ask_date'
-        keyboard = [['Abbrechen']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        await update.message.reply_text(
-            f"Setze Name auf: {new_event['name']}\n\n"
-            "An welchem Tag ist der Stammtisch? (z.B. '31.12')",
-            reply_markup=reply_markup
-        )
-
-    elif flow_step == 'ask_date':
-        # Simple parsing for dates like "11.03" or "am 11.03"
-        date_match = re.search(r"(\d{1,2})\.(\d{1,2})", text)
-        if date_match:
-            try:
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
-                now = dt.datetime.now(TZ_BERLIN)
-                year = now.year
-                # If date is in the past, assume next year
-                if dt.date(year, month, day) < now.date():
-                    year += 1
-                event_date = dt.date(year, month, day)
-                new_event['beginn'] = event_date.isoformat()
-                new_event['ende'] = event_date.isoformat()
-                
-                context.user_data['flow_step'] = 'confirm_date'
-                keyboard = [['Abbrechen', 'Ja']]
-                reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-                wd = util.get_weekday_de(event_date.isoformat())
-                await update.message.reply_text(
-                    f"Der {wd} {event_date.strftime('%d.%m.%Y')} wurde erkannt. Korrekt?",
-                    reply_markup=reply_markup
-                )
-            except ValueError:
-                await update.message.reply_text("Das scheint kein gültiges Datum zu sein. Bitte erneut versuchen (z.B. '31.12').")
-        else:
-            await update.message.reply_text("Ich konnte das Datum nicht erkennen. Bitte sende es im Format 'TT.MM'.")
+    match flow_step:
+        case Step.ASK_NAME:
+            if text.lower() == 'ja':
+                new_event['name'] = prev_event.get('name', 'Stammtisch')
+            else:
+                new_event['name'] = text
 
-    elif flow_step == 'confirm_date':
-        if text.lower() == 'ja':
-            context.user_data['flow_step'] = 'ask_time'
-            prev_time = prev_event.get('uhrzeit', '19:00')
-            keyboard = [['Abbrechen', 'Ja']]
-            reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-            await update.message.reply_text(
-                f"Um welche Uhrzeit ist der Stammtisch? Weiterhin um {prev_time} Uhr?",
-                reply_markup=reply_markup
+            context.user_data['flow_step'] = Step.ASK_DATE
+            await send_cancel(
+                f"Setze Name auf: {new_event['name']}\n\n"
+                "An welchem Tag ist der Stammtisch? (z.B. '31.12')"
             )
-        else:
-            context.user_data['flow_step'] = 'ask_date'
-            await update.message.reply_text("Bitte gib das Datum erneut ein (z.B. '31.12').")
 
-    elif flow_step == 'ask_time':
-        if text.lower() == 'ja':
-            new_event['uhrzeit'] = prev_event.get('uhrzeit', '19:00')
-        else:
-            # Try parsing time
-            time_match = re.search(r"(\d{1,2})[:.](\d{2})|\b(\d{1,2})\s*Uhr", text)
-            if time_match:
-                if time_match.group(1):
-                    new_event['uhrzeit'] = f"{int(time_match.group(1)):02d}:{int(time_match.group(2)):02d}"
+        case Step.ASK_DATE:
+            # Simple parsing for dates like "11.03" or "am 11.03"
+            date_match = _DATE_SHORT_RE.search(text)
+            if date_match:
+                try:
+                    day = int(date_match.group(1))
+                    month = int(date_match.group(2))
+                    today = dt.datetime.now(TZ_BERLIN).date()
+                    year = today.year
+                    # If date is in the past, assume next year
+                    if dt.date(year, month, day) < today:
+                        year += 1
+                    event_date = dt.date(year, month, day)
+                    new_event['beginn'] = event_date.isoformat()
+                    new_event['ende'] = event_date.isoformat()
+
+                    context.user_data['flow_step'] = Step.CONFIRM_DATE
+                    wd = util.get_weekday_de(event_date.isoformat())
+                    await send_yn(
+                        f"Der {wd} {event_date.day:02d}.{event_date.month:02d}.{event_date.year} wurde erkannt. Korrekt?"
+                    )
+                except ValueError:
+                    await update.message.reply_text("Das scheint kein gültiges Datum zu sein. Bitte erneut versuchen (z.B. '31.12').")
+            else:
+                await update.message.reply_text("Ich konnte das Datum nicht erkennen. Bitte sende es im Format 'TT.MM'.")
+
+        case Step.CONFIRM_DATE:
+            if text.lower() == 'ja':
+                context.user_data['flow_step'] = Step.ASK_TIME
+                prev_time = prev_event.get('uhrzeit', '19:00')
+                await send_yn(f"Um welche Uhrzeit ist der Stammtisch? Weiterhin um {prev_time} Uhr?")
+            else:
+                context.user_data['flow_step'] = Step.ASK_DATE
+                await update.message.reply_text("Bitte gib das Datum erneut ein (z.B. '31.12').")
+
+        case Step.ASK_TIME:
+            if text.lower() == 'ja':
+                new_event['uhrzeit'] = prev_event.get('uhrzeit', '19:00')
+            else:
+                # Try parsing time
+                time_match = _TIME_LOOSE_RE.search(text)
+                if time_match:
+                    if time_match.group(1):
+                        new_event['uhrzeit'] = f"{int(time_match.group(1)):02d}:{int(time_match.group(2)):02d}"
+                    else:
+                        new_event['uhrzeit'] = f"{int(time_match.group(3)):02d}:00"
                 else:
-                    new_event['uhrzeit'] = f"{int(time_match.group(3)):02d}:00"
+                    new_event['uhrzeit'] = "19:00" # fallback
+
+            context.user_data['flow_step'] = Step.ASK_PLZ
+            # Default PLZ from prev event or user profile
+            prev_plz = prev_event.get('plz') or user_data.get('plz', '').split(',')[0].strip()
+            if prev_plz:
+                await send_yn(f"Unter welcher PLZ findet das Treffen statt? Weiterhin unter {prev_plz}?")
             else:
-                new_event['uhrzeit'] = "19:00" # fallback
-
-        context.user_data['flow_step'] = 'ask_plz'
-        # Default PLZ from prev event or user profile
-        prev_plz = prev_event.get('plz') or user_data.get('plz', '').split(',')[0].strip()
-        if prev_plz:
-            keyboard = [['Abbrechen', 'Ja']]
-            reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-            await update.message.reply_text(
-                f"Unter welcher PLZ findet das Treffen statt? Weiterhin unter {prev_plz}?",
-                reply_markup=reply_markup
-            )
-        else:
-            keyboard = [['Abbrechen']]
-            reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-            await update.message.reply_text("Unter welcher PLZ findet das Treffen statt?", reply_markup=reply_markup)
+                await send_cancel("Unter welcher PLZ findet das Treffen statt?")
 
-    elif flow_step == 'ask_plz':
-        if text.lower() == 'ja':
-            new_event['plz'] = prev_event.get('plz') or user_data.get('plz', '').split(',')[0].strip()
-        else:
-            plz_match = re.search(r"\b(\d{5})\b", text)
-            if plz_match:
-                new_event['plz'] = plz_match.group(1)
+        case Step.ASK_PLZ:
+            if text.lower() == 'ja':
+                new_event['plz'] = prev_event.get('plz') or user_data.get('plz', '').split(',')[0].strip()
             else:
-                await update.message.reply_text("Bitte gib eine gültige 5-stellige PLZ an.")
-                return
+                plz_match = _PLZ_RE.search(text)
+                if plz_match:
+                    new_event['plz'] = plz_match.group(1)
+                else:
+                    await update.message.reply_text("Bitte gib eine gültige 5-stellige PLZ an.")
+                    return
+
+            # --- Metadata Carry-Forward ---
+            # If user confirmed same Name and PLZ, copy metadata from previous event
+            if prev_event and new_event.get('name') == prev_event.get('name') and new_event.get('plz') == prev_event.get('plz'):
+                # Copy all fields except those explicitly handled by the bot flow
+                excluded_keys = {'name', 'beginn', 'ende', 'uhrzeit', 'plz', 'kontakt', 'e-mail', 'kw', 'wochentag'}
+                for k, v in prev_event.items():
+                    if k not in excluded_keys and v:
+                        new_event[k] = v
+
+            new_event['kontakt'] = user_data.get('name', update.effective_user.full_name)
+            new_event['e-mail'] = user_data.get('e-mail', '')
+
+            # --- Final Confirmation Summary ---
+            date_str = new_event['beginn']
+            wd = util.get_weekday_de(date_str)
+            try:
+                d = dt.date.fromisoformat(date_str)
+                date_display = f"{d.day:02d}.{d.month:02d}.{d.year}"
+            except:
+                date_display = date_str
+
+            summary = (
+                "Erfassten Angaben für den neuen Termin:\n\n"
+                f"📍 Name: {new_event['name']}\n"
+                f"📅 Datum: {wd} {date_display}\n"
+                f"⏰ Zeit: {new_event['uhrzeit']}\n"
+                f"📮 PLZ: {new_event['plz']}\n"
+            )
 
-        # --- Metadata Carry-Forward ---
-        # If user confirmed same Name and PLZ, copy metadata from previous event
-        if prev_event and new_event.get('name') == prev_event.get('name') and new_event.get('plz') == prev_event.get('plz'):
-            # Copy all fields except those explicitly handled by the bot flow
-            excluded_keys = {'name', 'beginn', 'ende', 'uhrzeit', 'plz', 'kontakt', 'e-mail', 'kw', 'wochentag'}
-            for k, v in prev_event.items():
-                if k not in excluded_keys and v:
-                    new_event[k] = v
+            # Display metadata if present
+            if new_event.get('orga'):
+                summary += f"🏢 Orga: {new_event['orga']}\n"
+            if new_event.get('orga_webseite'):
+                summary += f"🔗 Web: {new_event['orga_webseite']}\n"
+            tg_val = new_event.get('telegram_group_id') or new_event.get('telegram')
+            if tg_val:
+                summary += f"📱 Telegram: {tg_val}\n"
 
-        new_event['kontakt'] = user_data.get('name', update.effective_user.full_name)
-        new_event['e-mail'] = user_data.get('e-mail', '')
+            summary += f"\nAlles so richtig?\n"
 
-        # --- Final Confirmation Summary ---
-        date_str = new_event['beginn']
-        wd = util.get_weekday_de(date_str)
-        try:
-            d = dt.date.fromisoformat(date_str)
-            date_display = d.strftime("%d.%m.%Y")
-        except:
-            date_display = date_str
+            context.user_data['flow_step'] = Step.CONFIRM_SAVE
+            await send_yn(summary)
 
-        summary = (
-            "Erfassten Angaben für den neuen Termin:\n\n"
-            f"📍 Name: {new_event['name']}\n"
-            f"📅 Datum: {wd} {date_display}\n"
-            f"⏰ Zeit: {new_event['uhrzeit']}\n"
-            f"📮 PLZ: {new_event['plz']}\n"
-        )
-        
-        # Display metadata if present
-        if new_event.get('orga'): 
-            summary += f"🏢 Orga: {new_event['orga']}\n"
-        if new_event.get('orga_webseite'): 
-            summary += f"🔗 Web: {new_event['orga_webseite']}\n"
-        tg_val = new_event.get('telegram_group_id') or new_event.get('telegram')
-        if tg_val: 
-            summary += f"📱 Telegram: {tg_val}\n"
-
-        summary += f"\nAlles so richtig?\n"
-        
-        context.user_data['flow_step'] = 'confirm_save'
-        keyboard = [['Abbrechen', 'Ja']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(summary, reply_markup=reply_markup)
+        case Step.CONFIRM_SAVE:
+            if text.lower() != 'ja':
+                await update.message.reply_text("Bitte bestätige mit 'Ja' oder nutze 'Abbrechen'.")
+                return
 
-    elif flow_step == 'confirm_save':
-        if text.lower() != 'ja':
-            await update.message.reply_text("Bitte bestätige mit 'Ja' oder nutze 'Abbrechen'.")
-            return
+            # --- Final Save ---
+            await update.message.reply_text("Speichere in GSheet...")
 
-        # --- Final Save ---
-        await update.message.reply_text("Speichere in GSheet...")
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        
-        try:
-            username = update.effective_user.username or "Unknown"
-            bot_state.sheet.log(f"User @{username} ({user_id}) created event: {new_event['name']} on {new_event['beginn']} at {new_event['plz']}")
-            await asyncio.to_thread(bot_state.sheet.append, "termine", [new_event])
-            
-            success_msg = "✅ Termin wurde erfolgreich gespeichert!"
-            if bot_state.sheet.sheet_id == PROD_SHEET:
-                success_msg += "\nDie Änderungen werden in 1-2 Minuten auf der Webseite sichtbar sein."
-                # Run sync and push in the background
-                plz = str(new_event.get('plz', ''))
-                asyncio.create_task(git_sync_and_push(bot_state.sheet.sheet_id, f"new event for {plz}"))
-
-            asyncio.create_task(announce_event(context.bot, new_event))
-            await update.message.reply_text(success_msg)
-        except Exception as e:
-            log.error(f"Error saving event: {e}")
-            await update.message.reply_text("❌ Fehler beim Speichern. Bitte versuche es später erneut.")
-        
-        await reset_flow("Was kann ich sonst für dich tun?")
+            try:
+                username = update.effective_user.username or "Unknown"
+                bot_state.sheet.log(f"User @{username} ({user_id}) created event: {new_event['name']} on {new_event['beginn']} at {new_event['plz']}")
+                # chat action and sheet write are independent, run them concurrently
+                await asyncio.gather(
+                    context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"),
+                    bot_state.call_sheet("termine", bot_state.sheet.append, "termine", [new_event]),
+                )
+                bot_state.invalidate_termine()
+
+                success_msg = "✅ Termin wurde erfolgreich gespeichert!"
+                if bot_state.sheet.sheet_id == PROD_SHEET:
+                    success_msg += "\nDie Änderungen werden in 1-2 Minuten auf der Webseite sichtbar sein."
+                    # Run sync and push in the background
+                    plz = str(new_event.get('plz', ''))
+                    schedule_git_sync_and_push(bot_state.sheet.sheet_id, f"new event for {plz}")
+
+                asyncio.create_task(announce_event(context.bot, new_event))
+                await update.message.reply_text(success_msg)
+            except Exception as e:
+                log.error(f"Error saving event: {e}")
+                await update.message.reply_text("❌ Fehler beim Speichern. Bitte versuche es später erneut.")
+
+            await reset_flow("Was kann ich sonst für dich tun?")
 
 
 async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -629,26 +709,17 @@ async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     if current_state != 'awaiting_delete_selection':
         # --- Step 1: Fetch and display candidates ---
-        user_plz_raw = user_data.get("plz", "")
-        user_plz = {plz.strip() for plz in user_plz_raw.split(",") if plz.strip()}
-        
+        user_plz = user_data.get("_plz_set", frozenset())
+
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        termine = await asyncio.to_thread(bot_state.sheet.read, "termine")
-        
-        candidates = []
-        for i, t in enumerate(termine):
-            t_plz = str(t.get('plz', '')).strip()
-            if t_plz in user_plz:
-                # Store the row index (2 for the first data row)
-                candidates.append((i + 2, t))
-        
+        candidates = await bot_state.get_termine_by_plz(user_plz, force=True)
+
         if not candidates:
             await update.message.reply_text("Ich konnte keine Termine für deine PLZ finden.")
             return
 
-        # Sort by date (descending)
-        candidates.sort(key=lambda x: x[1].get('beginn', ''), reverse=True)
-        top_4 = candidates[:4]
+        # 4 most recent by date, shown oldest first
+        top_4 = heapq.nlargest(4, candidates, key=lambda x: x[1].get('beginn', ''))
         top_4.reverse()
         
         context.user_data['state'] = 'awaiting_delete_selection'
@@ -665,7 +736,7 @@ async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE
             date_display = date_str
             try:
                 d = dt.date.fromisoformat(date_str)
-                date_display = d.strftime("%d.%m.%Y")
+                date_display = f"{d.day:02d}.{d.month:02d}.{d.year}"
             except: pass
 
             keyboard.append([f"{wd} {date_display} {time} - {plz}"])
@@ -693,7 +764,7 @@ async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE
             date_display = date_str
             try:
                 d = dt.date.fromisoformat(date_str)
-                date_display = d.strftime("%d.%m.%Y")
+                date_display = f"{d.day:02d}.{d.month:02d}.{d.year}"
             except: pass
 
             btn_text = f"{wd} {date_display} {time} - {plz}"
@@ -712,7 +783,7 @@ async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE
         wd = util.get_weekday_de(date_str)
         try:
             d = dt.date.fromisoformat(date_str)
-            date_display = d.strftime("%d.%m.%Y")
+            date_display = f"{d.day:02d}.{d.month:02d}.{d.year}"
         except:
             date_display = date_str
 
@@ -723,17 +794,15 @@ async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE
             f"📅 {wd} {date_display} {t.get('uhrzeit')}\n"
             f"📮 PLZ: {t.get('plz')}\n"
         )
-        keyboard = [['Abbrechen', 'Ja']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(summary, reply_markup=reply_markup)
+        await update.message.reply_text(summary, reply_markup=YES_CANCEL_KB)
         
     else:
         # User is confirming deletion
         if text.lower() == 'ja':
             gs_idx = selected_idx
             await update.message.reply_text("Lösche in GSheet...")
-            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-            
+
+
             # Find the event data for the commit message before deleting
             target_event = None
             for idx, ev in context.user_data.get('delete_candidates', []):
@@ -746,14 +815,19 @@ async def handle_delete_event(update: Update, context: ContextTypes.DEFAULT_TYPE
                     username = update.effective_user.username or "Unknown"
                     bot_state.sheet.log(f"User @{username} ({user_id}) deleted event: {target_event.get('name')} on {target_event.get('beginn')} at {target_event.get('plz')}")
                 
-                await asyncio.to_thread(bot_state.sheet.delete_row, "termine", gs_idx)
-                
+                # chat action and sheet write are independent, run them concurrently
+                await asyncio.gather(
+                    context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing"),
+                    bot_state.call_sheet("termine", bot_state.sheet.delete_row, "termine", gs_idx),
+                )
+                bot_state.invalidate_termine()
+
                 success_msg = "✅ Termin wurde gelöscht."
                 if bot_state.sheet.sheet_id == PROD_SHEET:
                     success_msg += "\nDie Änderungen werden in 1-2 Minuten auf der Webseite sichtbar sein."
                     if target_event:
                         plz = str(target_event.get('plz', ''))
-                        asyncio.create_task(git_sync_and_push(bot_state.sheet.sheet_id, f"delete event for {plz}"))
+                        schedule_git_sync_and_push(bot_state.sheet.sheet_id, f"delete event for {plz}")
 
                 await update.message.reply_text(success_msg)
             except Exception as e:
@@ -793,7 +867,7 @@ async def handle_manage_users(update: Update, context: ContextTypes.DEFAULT_TYPE
         context.user_data['target_status'] = target_status
         
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        rows = await asyncio.to_thread(bot_state.sheet.read, "kontakte")
+        rows = await bot_state.call_sheet("kontakte", bot_state.sheet.read, "kontakte")
         
         candidates = []
         for i, row in enumerate(rows):
@@ -853,9 +927,7 @@ async def handle_manage_users(update: Update, context: ContextTypes.DEFAULT_TYPE
             f"🆔 Telegram ID: {row.get('telegram_id')}\n"
             f"🏷 Username: @{row.get('username', 'N/A')}\n"
         )
-        keyboard = [['Abbrechen', 'Ja']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(summary, reply_markup=reply_markup)
+        await update.message.reply_text(summary, reply_markup=YES_CANCEL_KB)
         return
 
     if current_state == 'awaiting_user_confirm':
@@ -871,7 +943,7 @@ async def handle_manage_users(update: Update, context: ContextTypes.DEFAULT_TYPE
 
         try:
             # We need to find the column index for "Bot modus"
-            headers = await asyncio.to_thread(bot_state.sheet._get_headers, "kontakte")
+            headers = await bot_state.call_sheet("kontakte", bot_state.sheet._get_headers, "kontakte")
             col_idx = -1
             for i, h in enumerate(headers):
                 if gu._normalize_key(h) == "bot_modus":
@@ -889,14 +961,18 @@ async def handle_manage_users(update: Update, context: ContextTypes.DEFAULT_TYPE
 
             # Perform update
             body = {"values": [[target_status]]}
-            bot_state.sheet.service.spreadsheets().values().update(
-                spreadsheetId=bot_state.sheet.sheet_id,
-                range=f"kontakte!{range_name}",
-                valueInputOption="RAW",
-                body=body
-            ).execute()
 
-            bot_state.sync_users()
+            def _do_update():
+                return bot_state.sheet.service().spreadsheets().values().update(
+                    spreadsheetId=bot_state.sheet.sheet_id,
+                    range=f"kontakte!{range_name}",
+                    valueInputOption="RAW",
+                    body=body
+                ).execute()
+
+            await bot_state.call_sheet("kontakte", _do_update)
+
+            await bot_state.call_sheet("kontakte", bot_state.sync_users)
 
             if target_status == "Aktiv":
                 user_tg_id = row.get("telegram_id")
@@ -920,17 +996,33 @@ async def handle_manage_users(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 
 _CLIENT: "telethon.TelegramClient" = None
+_CLIENT_STARTED = False
 
 
-def init_telethon_client() -> "telethon.TelegramClient":
-    global _CLIENT
+async def get_telethon_client() -> "telethon.TelegramClient":
+    # The MTProto handshake takes seconds, so the client is started once
+    # and stays connected for the process lifetime instead of being torn
+    # down after every use.
+    global _CLIENT, _CLIENT_STARTED
 
     if _CLIENT is None:
         import telethon
         _CLIENT = telethon.TelegramClient(FSTISCH_APP_TITLE, FSTISCH_API_ID, FSTISCH_API_HASH)
+    if not _CLIENT_STARTED:
+        await _CLIENT.start(bot_token=FSTISCH_BOT_TOKEN)
+        _CLIENT_STARTED = True
     return _CLIENT
 
 
+async def disconnect_telethon_client():
+    global _CLIENT, _CLIENT_STARTED
+
+    if _CLIENT is not None and _CLIENT_STARTED:
+        await _CLIENT.disconnect()
+    _CLIENT = None
+    _CLIENT_STARTED = False
+
+
 async def catch_up():
     log.debug(f"FSTISCH_API_ID: {FSTISCH_API_ID}")
     log.debug(f"FSTISCH_API_HASH: {'set' if FSTISCH_API_HASH else 'NOT SET'}")
@@ -941,20 +1033,43 @@ async def catch_up():
         return
 
     log.info("Starting Telethon catch-up...")
-    client = init_telethon_client()
-    
-    # Ensure correct bot authentication before entering context
-    await client.start(bot_token=FSTISCH_BOT_TOKEN)
-    
-    async with client:
-        me = await client.get_me()
-        log.info(f"Catch-up client initialized as {me.username}")
-        # iter_dialogs is not supported for bots (BotMethodInvalidError)
-        # So we skip the recent message check here.
-    
-    # Cleanup: Reset the global _CLIENT so the main loop creates a fresh one.
-    global _CLIENT
-    _CLIENT = None
+    client = await get_telethon_client()
+    me = await client.get_me()
+    log.info(f"Catch-up client initialized as {me.username}")
+    # iter_dialogs is not supported for bots (BotMethodInvalidError)
+    # So we skip the recent message check here.
+
+
+# With concurrent_updates the application dispatches updates in parallel;
+# a lock per chat keeps messages of one conversation in order while a chat
+# stuck in slow Sheets I/O no longer blocks the others.
+_CHAT_LOCKS: dict[int, asyncio.Lock] = collections.defaultdict(asyncio.Lock)
+
+
+async def dispatch_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async with _CHAT_LOCKS[update.effective_chat.id]:
+        await start(update, context)
+
+
+async def dispatch_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    async with _CHAT_LOCKS[update.effective_chat.id]:
+        await handle_message(update, context)
+
+
+async def _post_init(application):
+    await catch_up()
+
+
+async def _post_shutdown(application):
+    await disconnect_telethon_client()
+
+
+async def _sync_users_job(context: ContextTypes.DEFAULT_TYPE):
+    bot_state: BotState = context.bot_data['state']
+    try:
+        await bot_state.call_sheet("kontakte", bot_state.sync_all)
+    except Exception as ex:
+        log.error(f"Error during periodic user sync: {ex}")
 
 
 def main():
@@ -974,16 +1089,22 @@ def main():
 
     sheet_id = PROD_SHEET if args.sheet_id == 'prod' else args.sheet_id
     state = BotState(sheet_id)
-    state.sync_users()
-
-    # Initial catch-up
-    asyncio.run(catch_up())
-
-    application = ApplicationBuilder().token(FSTISCH_BOT_TOKEN).build()
+    state.sync_all()
+
+    # Initial catch-up (pure startup latency, so optional). It runs via
+    # post_init so the telethon client lives on the same event loop as
+    # run_polling and its connection can be reused for later calls.
+    builder = ApplicationBuilder().token(FSTISCH_BOT_TOKEN).concurrent_updates(True)
+    if not args.skip_catchup:
+        builder = builder.post_init(_post_init)
+    application = builder.post_shutdown(_post_shutdown).build()
     application.bot_data['state'] = state
 
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), handle_message))
+    application.add_handler(CommandHandler("start", dispatch_start))
+    application.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), dispatch_message))
+
+    # Keep the kontakte cache fresh without a sheets read on the message path
+    application.job_queue.run_repeating(_sync_users_job, interval=300, first=300)
 
     log.info("Bot is starting...")
     application.run_polling()
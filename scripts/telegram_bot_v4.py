@@ -5,7 +5,7 @@
 #   "pudb", "ipython",
 #   "pillow>=11.1.0",
 #   "telethon>=1.42.0",
-#   "python-telegram-bot>=22.5",
+#   "python-telegram-bot[rate-limiter,http2]>=22.5",
 #   "python-dateutil",
 #   "google-api-python-client~=2.188.0",
 #   "google-auth~=2.38.0",
@@ -30,9 +30,13 @@ Options:
 import os
 import re
 import sys
+import json
+import time
+import heapq
 import asyncio
 import logging
 import typing as typ
+import functools as ft
 import pathlib as pl
 import datetime as dt
 import zoneinfo as zi
@@ -61,15 +65,54 @@ FSTISCH_BOT_TOKEN = os.environ.get('FSTISCH_TEST_BOT_TOKEN')
 PROD_SHEET = "1-BypxZnsRGFJ8XeuCIFyleF-4OK-ndsUvpaV6_Oi95s"
 TEST_SHEET = "15QeC3F4CPHLNjroghRXHDjO8oBC2wmJBPhTLHF_5XOs"
 
-ADMIN_IDS = {
+ADMIN_IDS = frozenset({
     "601316285",    # Manuel
     "1473328156",   # Lukas
-}
+})
+
+
+# patterns used on every message in the create-event flow
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})")
+_TIME_RE = re.compile(r"(\d{1,2})[:.](\d{2})|\b(\d{1,2})\s*Uhr")
+_PLZ_RE = re.compile(r"\b(\d{5})\b")
+_MIGRATION_RE = re.compile(r"New chat id: (-?\d+)")
+
+# static keyboards, instantiated once instead of per message
+_MAIN_KB_ROWS = [['Bot Info', 'Meine Termine'], ['Termin Erstellen', 'Termin Löschen']]
+_USER_KB = tg.ReplyKeyboardMarkup(_MAIN_KB_ROWS, resize_keyboard=True)
+_ADMIN_KB = tg.ReplyKeyboardMarkup(
+    _MAIN_KB_ROWS + [['Nutzer Aktivieren', 'Nutzer Deaktivieren']], resize_keyboard=True
+)
 
 
 User = dict[str, str]
 
 
+@ft.lru_cache(maxsize=4096)
+def _fmt_de(date_str: str) -> tuple[str, str]:
+    """(weekday_de, dd.mm.yyyy) for an ISO date string, verbatim fallback."""
+    wd = gu.get_weekday_de(date_str)
+    # cheap shape check; raising/unwinding ValueError for every
+    # "Unbekannt" or malformed cell costs far more than the comparison
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            d = dt.date.fromisoformat(date_str)
+            return wd, f"{d.day:02d}.{d.month:02d}.{d.year}"
+        except ValueError:
+            pass
+    return wd, date_str
+
+
+def _col_letter(col_idx: int) -> str:
+    """A1-notation letters for a zero-based column index (25 -> Z, 26 -> AA)."""
+    letters = ""
+    n = col_idx + 1
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
 def get_user(ctx, tg_id: str) -> User | None:
     sheet = gu.GSheet(ctx['sheet_id'])
 
@@ -81,27 +124,204 @@ def get_user(ctx, tg_id: str) -> User | None:
 
 
 
+# Reads of a worksheet take seconds and count against the GSheet quota,
+# so interactive flows reuse a short-lived cache.
+SHEET_CACHE_TTL = 45
+
+# Snapshot of the kontakte tab, so a restarted bot can answer
+# immediately while the first network sync is still running.
+USERS_CACHE_FILE = pl.Path("data") / "kontakte_cache.json"
+USERS_SYNC_INTERVAL = 15 * 60
+
+
 class BotState:
     def __init__(self, sheet_id: str):
         self.sheet = gu.GSheet(sheet_id)
         self.users = {}  # telegram_id -> user_data
         self.last_sync = None
         self.start_time = dt.datetime.now(TZ_BERLIN)
+        self._sheet_cache: dict[str, tuple[float, list[dict]]] = {}
+        self._sheet_cache_locks: dict[str, asyncio.Lock] = {}
+        self._plz_index: dict[str, list[tuple[int, dict]]] = {}
+        self.log_queue: asyncio.Queue = asyncio.Queue()
+        self.write_queue: asyncio.Queue = asyncio.Queue()
+        self._header_index_cache: dict[str, dict[str, int]] = {}
+        self._bg_tasks: list[asyncio.Task] = []
+        self._load_users_cache()
+
+    def ensure_background_tasks(self) -> None:
+        """Starts the queue workers once, lazily, on a running loop.
+
+        BotState is constructed before run_polling starts the event
+        loop, so the workers are scheduled on first use instead of in
+        __init__.
+        """
+        if self._bg_tasks:
+            return
+        self._bg_tasks = [
+            asyncio.create_task(periodic_sync(self)),
+            asyncio.create_task(_log_worker(self)),
+            asyncio.create_task(_write_worker(self)),
+        ]
+
+    def header_index(self, tab: str) -> dict[str, int]:
+        """Normalized header name -> zero-based column index.
+
+        Headers only change on schema edits; the cache is cleared by
+        sync_users, so each process pays the lookup round trip once
+        per sync interval at most.
+        """
+        cached = self._header_index_cache.get(tab)
+        if cached is None:
+            headers = self.sheet._get_headers(tab)
+            cached = {gu._normalize_key(h): i for i, h in enumerate(headers)}
+            self._header_index_cache[tab] = cached
+        return cached
+
+    def col_index(self, tab: str, key: str) -> int:
+        """Column index for a normalized header key, -1 when missing."""
+        return self.header_index(tab).get(key, -1)
+
+    def log(self, message: str, level: int = logging.INFO) -> None:
+        """Queues a log sheet entry; _log_worker writes them in batches.
+
+        Unlike sheet.log this does not block the handler on a Sheets
+        write, so the user reply goes out one round trip earlier.
+        """
+        log.log(level=level, msg=message)
+        self.ensure_background_tasks()
+        self.log_queue.put_nowait({
+            "timestamp": dt.datetime.now().isoformat(sep=" "),
+            "level": logging.getLevelName(level),
+            "message": message,
+        })
+
+    async def read_cached(self, tab: str, ttl: float = SHEET_CACHE_TTL) -> list[dict]:
+        self.ensure_background_tasks()
+        # the per-tab lock prevents a cache stampede when several users
+        # hit an expired entry at the same time
+        lock = self._sheet_cache_locks.setdefault(tab, asyncio.Lock())
+        async with lock:
+            cached = self._sheet_cache.get(tab)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            rows = await asyncio.to_thread(self.sheet.read, tab)
+            self._sheet_cache[tab] = (time.monotonic(), rows)
+
+            if tab == "termine":
+                self._rebuild_plz_index(rows)
+
+            return rows
+
+    def _rebuild_plz_index(self, rows: list[dict]) -> None:
+        plz_index: dict[str, list[tuple[int, dict]]] = {}
+        for i, row in enumerate(rows):
+            plz = str(row.get('plz', '')).strip()
+            # i + 2: sheet row index of the first data row
+            plz_index.setdefault(plz, []).append((i + 2, row))
+        self._plz_index = plz_index
+
+    async def termine_by_plz(self, user_plz: set[str], ttl: float = SHEET_CACHE_TTL) -> list[tuple[int, dict]]:
+        """Rows matching any of the given PLZ, as (sheet_row_idx, termin)."""
+        await self.read_cached("termine", ttl=ttl)
+        matches: list[tuple[int, dict]] = []
+        for plz in user_plz:
+            if plz:
+                matches.extend(self._plz_index.get(plz, ()))
+        return matches
+
+    def is_cached(self, tab: str, ttl: float = SHEET_CACHE_TTL) -> bool:
+        cached = self._sheet_cache.get(tab)
+        return bool(cached) and time.monotonic() - cached[0] < ttl
+
+    def invalidate_cache(self, tab: str) -> None:
+        self._sheet_cache.pop(tab, None)
+
+    # write-through: after our own append/delete the cache is still
+    # authoritative, so the next read needs no round trip to the sheet
+
+    def cache_append(self, tab: str, row: dict) -> None:
+        cached = self._sheet_cache.get(tab)
+        if cached is None:
+            return
+        rows = cached[1]
+        rows.append(row)
+        self._sheet_cache[tab] = (time.monotonic(), rows)
+        if tab == "termine":
+            self._rebuild_plz_index(rows)
+
+    def cache_delete(self, tab: str, gs_idx: int) -> None:
+        cached = self._sheet_cache.get(tab)
+        if cached is None:
+            return
+        rows = cached[1]
+        list_idx = gs_idx - 2
+        if 0 <= list_idx < len(rows):
+            del rows[list_idx]
+            self._sheet_cache[tab] = (time.monotonic(), rows)
+            if tab == "termine":
+                self._rebuild_plz_index(rows)
+        else:
+            # index out of step with the sheet, force a fresh read
+            self.invalidate_cache(tab)
+
+    def _load_users_cache(self) -> None:
+        try:
+            with USERS_CACHE_FILE.open() as fobj:
+                self.users = json.load(fobj)
+            for row in self.users.values():
+                # sets are persisted as lists
+                row["_plz_set"] = set(row.get("_plz_set", ()))
+            log.info(f"Loaded {len(self.users)} users from cache.")
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def _save_users_cache(self) -> None:
+        USERS_CACHE_FILE.parent.mkdir(exist_ok=True)
+        USERS_CACHE_FILE.write_text(json.dumps(self.users, indent=2, sort_keys=True, default=sorted))
 
     def sync_users(self):
         log.info("Syncing users from GSheet...")
+        self._header_index_cache.clear()
         rows = self.sheet.read("kontakte")
         new_users = {}
         for row in rows:
             tg_id = row.get("telegram_id")
             if tg_id:
+                # hoist per-message string work out of the handlers
+                row["_plz_set"] = {p.strip() for p in row.get("plz", "").split(",") if p.strip()}
                 new_users[str(tg_id)] = row
         self.users = new_users
         self.last_sync = dt.datetime.now(TZ_BERLIN)
+        self._save_users_cache()
         log.info(f"Synced {len(self.users)} users.")
 
+    def set_user_status(self, row: dict, target_status: str) -> None:
+        """Updates the caches in place after a single-cell status write.
+
+        Avoids a full sync_users re-read just to reflect one changed
+        cell; row is a reference into the cached kontakte rows.
+        """
+        row["bot_modus"] = target_status
+        tg_id = str(row.get("telegram_id", ""))
+        if not tg_id:
+            return
+
+        cached_user = self.users.get(tg_id)
+        if cached_user is None:
+            row.setdefault("_plz_set", {
+                p.strip() for p in row.get("plz", "").split(",") if p.strip()
+            })
+            self.users[tg_id] = row
+        else:
+            cached_user["bot_modus"] = target_status
+        self._save_users_cache()
+
     def is_user_active(self, tg_id: str | int) -> tuple[bool, str | None]:
-        tg_id = str(tg_id)
+        # callers already pass str; avoid an allocation on every message
+        if not isinstance(tg_id, str):
+            tg_id = str(tg_id)
         if tg_id in ADMIN_IDS:
             return True, "Aktiv"
 
@@ -116,23 +336,125 @@ class BotState:
         return False, user.get("bot_modus", "Inaktiv")
 
 
-async def announce_event(bot, event: dict):
-    tg_target = event.get('telegram_group_id')
-    if not tg_target:
-        tg_target = "-1003804237556"
-        log.info(f"No telegram target found in event data. Using fallback: {tg_target}")
-
-    # Clean up target (basic handling)
-    tg_target = tg_target.strip()
-    if "/" in tg_target: # Handle full URLs
-         tg_target = tg_target.split("/")[-1]
-    
-    # If target looks like an ID (digits, optionally starting with -), convert to int
-    if tg_target.lstrip('-').isdigit():
+# raw telegram_group_id -> chat id that worked last time, so repeat
+# announcements skip the candidate probing (every miss is a full API call)
+CHAT_ID_MAP_FILE = pl.Path("data") / "telegram_chat_ids.json"
+_CHAT_ID_MAP: dict[str, int] | None = None
+
+
+def _load_chat_id_map() -> dict[str, int]:
+    global _CHAT_ID_MAP
+    if _CHAT_ID_MAP is None:
         try:
-             tg_target = int(tg_target)
-        except ValueError:
-             pass
+            with CHAT_ID_MAP_FILE.open() as fobj:
+                _CHAT_ID_MAP = {key: int(val) for key, val in json.load(fobj).items()}
+        except (FileNotFoundError, ValueError):
+            _CHAT_ID_MAP = {}
+    return _CHAT_ID_MAP
+
+
+def _save_chat_id_map() -> None:
+    if _CHAT_ID_MAP is not None:
+        CHAT_ID_MAP_FILE.parent.mkdir(exist_ok=True)
+        CHAT_ID_MAP_FILE.write_text(json.dumps(_CHAT_ID_MAP, indent=2, sort_keys=True))
+
+
+async def periodic_sync(state: BotState, interval: float = USERS_SYNC_INTERVAL):
+    # started via BotState.ensure_background_tasks
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(state.sync_users)
+        except Exception as ex:
+            log.error(f"Error during periodic user sync: {ex}")
+
+
+LOG_BATCH_SIZE = 20
+LOG_BATCH_INTERVAL = 5.0
+
+
+async def _log_worker(state: BotState):
+    # started via BotState.ensure_background_tasks
+    while True:
+        batch = [await state.log_queue.get()]
+        deadline = time.monotonic() + LOG_BATCH_INTERVAL
+        while len(batch) < LOG_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(state.log_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await asyncio.to_thread(state.sheet.append, "log", batch)
+        except Exception as ex:
+            log.error(f"Error writing {len(batch)} log entries to sheet: {ex}")
+
+
+# Admin confirmations arriving within half a second of each other end up
+# in one values.batchUpdate call instead of one update RPC per cell.
+WRITE_FLUSH_INTERVAL = 0.5
+
+
+async def _write_worker(state: BotState):
+    # started via BotState.ensure_background_tasks
+    while True:
+        first = await state.write_queue.get()
+        await asyncio.sleep(WRITE_FLUSH_INTERVAL)
+        batch = [first]
+        while not state.write_queue.empty():
+            batch.append(state.write_queue.get_nowait())
+
+        data = [value_range for value_range, _ in batch]
+
+        def _do_batch_update():
+            return state.sheet.service().spreadsheets().values().batchUpdate(
+                spreadsheetId=state.sheet.sheet_id,
+                body={"valueInputOption": "RAW", "data": data},
+            ).execute()
+
+        try:
+            await asyncio.to_thread(_do_batch_update)
+            batch_exc = None
+        except Exception as ex:
+            # the waiting handlers report the failure to their users
+            batch_exc = ex
+
+        for _, done in batch:
+            # a waiter that timed out (wait_for cancels its future) or was
+            # cancelled is already resolved; touching it again would raise
+            # InvalidStateError and kill the worker loop
+            if done.done():
+                continue
+            if batch_exc is None:
+                done.set_result(None)
+            else:
+                done.set_exception(batch_exc)
+
+
+@ft.lru_cache(maxsize=1024)
+def _parse_chat_target(raw: str) -> int | str:
+    """Canonicalizes a telegram_group_id cell to a chat id or username.
+
+    Handles full invite URLs and numeric ids (optionally '-' prefixed);
+    cached so repeat announcements and retries skip the parsing.
+    """
+    target = raw.strip()
+    if "/" in target:  # Handle full URLs
+        target = target.split("/")[-1]
+    if target.lstrip('-').isdigit():
+        return int(target)
+    return target
+
+
+async def announce_event(bot, event: dict):
+    raw_target = event.get('telegram_group_id')
+    if not raw_target:
+        raw_target = "-1003804237556"
+        log.info(f"No telegram target found in event data. Using fallback: {raw_target}")
+
+    tg_target = _parse_chat_target(raw_target)
 
     log.info(f"Attempting to announce event to Telegram group: {tg_target}")
 
@@ -143,12 +465,7 @@ async def announce_event(bot, event: dict):
         time = event.get('uhrzeit', '19:00')
         plz = event.get('plz', '')
         
-        wd = gu.get_weekday_de(date_str)
-        try:
-           d = dt.date.fromisoformat(date_str)
-           date_display = d.strftime("%d.%m.%Y")
-        except:
-           date_display = date_str
+        wd, date_display = _fmt_de(date_str)
 
         msg = (
             f"📢 <b>Neuer Termin: {name}</b>\n\n"
@@ -158,13 +475,23 @@ async def announce_event(bot, event: dict):
         )
 
         # Try invalidating cache or different ID formats if "Chat not found"
+        chat_id_map = _load_chat_id_map()
+        cached_id = chat_id_map.get(str(tg_target))
+
         chat_id_candidates = [tg_target]
         if isinstance(tg_target, int) and tg_target > 0:
             # Maybe it's a supergroup without the -100 prefix
             chat_id_candidates.append(int(f"-100{tg_target}"))
             # Maybe it's a basic group (negative ID)
             chat_id_candidates.append(-tg_target)
-        
+
+        # A previously resolved id goes first, so repeat announcements
+        # hit on the first try instead of probing.
+        if cached_id is not None and cached_id in chat_id_candidates:
+            chat_id_candidates.remove(cached_id)
+        if cached_id is not None:
+            chat_id_candidates.insert(0, cached_id)
+
         sent_msg = None
         used_chat_id = None
         
@@ -177,7 +504,7 @@ async def announce_event(bot, event: dict):
             except Exception as e:
                 log.warning(f"Failed to send to {cid}: {e}")
                 # Check for "Group migrated to supergroup. New chat id: <id>"
-                migration_match = re.search(r"New chat id: (-?\d+)", str(e))
+                migration_match = _MIGRATION_RE.search(str(e))
                 if migration_match:
                     new_chat_id = int(migration_match.group(1))
                     log.info(f"Detected group migration. Retrying with new chat id: {new_chat_id}")
@@ -193,36 +520,58 @@ async def announce_event(bot, event: dict):
              log.error(f"Could not send announcement to {tg_target} (tried: {chat_id_candidates})")
              return
 
+        if chat_id_map.get(str(tg_target)) != used_chat_id:
+            chat_id_map[str(tg_target)] = used_chat_id
+            _save_chat_id_map()
+
         # Update tg_target to the working one for pinning/polling
         tg_target = used_chat_id
-        
-        # Pin the message
-        try:
-            await bot.pin_chat_message(chat_id=tg_target, message_id=sent_msg.message_id, disable_notification=False)
-            log.info(f"Announcement pinned in {tg_target}")
-        except Exception as pin_ex:
-            log.warning(f"Could not pin message in {tg_target}: {pin_ex}")
 
-        # Send Poll
-        try:
-            options = ["Ja", "Ja + 1", "Vielleicht", "Zeige Ergebnis"]
-            await bot.send_poll(
+        # Pin and poll are independent once the message is sent, so both
+        # requests fly concurrently on the shared connection.
+        options = ["Ja", "Ja + 1", "Vielleicht", "Zeige Ergebnis"]
+        pin_res, poll_res = await asyncio.gather(
+            bot.pin_chat_message(chat_id=tg_target, message_id=sent_msg.message_id, disable_notification=False),
+            bot.send_poll(
                 chat_id=tg_target,
                 question="Wer ist dabei?",
                 options=options,
                 is_anonymous=False,
                 allows_multiple_answers=False,
                 type='regular'
-            )
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(pin_res, Exception):
+            log.warning(f"Could not pin message in {tg_target}: {pin_res}")
+        else:
+            log.info(f"Announcement pinned in {tg_target}")
+        if isinstance(poll_res, Exception):
+            log.error(f"Could not send poll to {tg_target}: {poll_res}")
+        else:
             log.info(f"Poll sent to {tg_target}")
-            
-        except Exception as poll_ex:
-            log.error(f"Could not send poll to {tg_target}: {poll_ex}")
 
     except Exception as e:
         log.error(f"Error executing announcement: {e}")
 
 
+async def announce_events(bot, events: list[dict]):
+    """Fan out announcements concurrently, bounded below the group rate cap.
+
+    The AIORateLimiter smooths the individual requests; the semaphore just
+    keeps the number of in-flight announcements from growing unbounded.
+    """
+    sem = asyncio.Semaphore(20)
+
+    async def _one(event: dict):
+        async with sem:
+            await announce_event(bot, event)
+
+    async with asyncio.TaskGroup() as task_group:
+        for event in events:
+            task_group.create_task(_one(event))
+
+
 WELCOME_MESSAGE = (
     "Beep, boop 🤖\n\n"
     "Hallo, ich bin der freiheitliche-stammtische.de Bot!\n"
@@ -252,89 +601,86 @@ async def handle_message(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT
     state = context.user_data.get('state')
     log.info(f"handle_message: user_id={user_id}, state={state}, text='{text}'")
 
-    if text.lower() in ("bot info", "botinfo", "info"):
-        now = dt.datetime.now(TZ_BERLIN)
-        start_time_str = bot_state.start_time.strftime('%d.%m.%Y %H:%M:%S')
-        msg = (
-            WELCOME_MESSAGE +
-            f"Bot gestartet: {start_time_str}\n"
-            f"Aktuelle Zeit: {now.strftime('%d.%m.%Y %H:%M:%S')}"
-        )
-        await update.message.reply_text(msg)
-    elif text.lower() in ("meine termine", "termine"):
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        await list_my_events(update, context)
-    elif text in ("Nutzer Aktivieren", "Nutzer Deaktivieren") or str(state).startswith('awaiting_user_'):
-        if user_id in ADMIN_IDS:
-            await handle_manage_users(update, context)
-        else:
-            await update.message.reply_text("Diese Funktion ist nur für Administratoren verfügbar.")
-    elif text.lower() in ("termin erstellen", "erstellen", "neu") or state == 'awaiting_event_info':
+    handler = _COMMANDS.get(text.casefold())
+    if handler is not None:
+        await handler(update, context)
+    # stateful branches: the user is mid-flow, the text is an answer
+    elif str(state).startswith('awaiting_user_'):
+        await handle_manage_users_cmd(update, context)
+    elif state == 'awaiting_event_info':
         await handle_create_event(update, context)
-    elif text.lower() in ("termin löschen", "löschen") or state == 'awaiting_delete_selection':
+    elif state == 'awaiting_delete_selection':
         await handle_delete_event(update, context)
     else:
         await update.message.reply_text("Ich habe dich nicht verstanden.\nNutze /start.")
 
 
+async def handle_bot_info(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE):
+    bot_state: BotState = context.bot_data['state']
+    now = dt.datetime.now(TZ_BERLIN)
+    start_time_str = bot_state.start_time.strftime('%d.%m.%Y %H:%M:%S')
+    msg = (
+        WELCOME_MESSAGE +
+        f"Bot gestartet: {start_time_str}\n"
+        f"Aktuelle Zeit: {now.strftime('%d.%m.%Y %H:%M:%S')}"
+    )
+    await update.message.reply_text(msg)
+
+
+async def handle_manage_users_cmd(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE):
+    user_id = str(update.effective_user.id)
+    if user_id in ADMIN_IDS:
+        await handle_manage_users(update, context)
+    else:
+        await update.message.reply_text("Diese Funktion ist nur für Administratoren verfügbar.")
+
+
 async def list_my_events(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE):
     user_id = str(update.effective_user.id)
     bot_state: BotState = context.bot_data['state']
     user_data = bot_state.users.get(user_id)
-    user_plz_raw = user_data.get("plz", "")
-    user_plz = {plz.strip() for plz in user_plz_raw.split(",")}
-    
+    user_plz = user_data.get("_plz_set", set())
+
     if not user_plz:
         await update.message.reply_text("In deinem Kontakt-Profil ist keine PLZ hinterlegt.")
         return
 
     log.info(f"Fetching events for PLZ {user_plz}")
-    
-    # Send progress indicator immediately
-    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-    status_msg = await update.message.reply_text("🔍 Suche Termine...")
 
-    termine = await asyncio.to_thread(bot_state.sheet.read, "termine")
+    # Progress indicator, but only when the sheet call will actually block
+    status_msg = None
+    if not bot_state.is_cached("termine"):
+        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+        status_msg = await update.message.reply_text("🔍 Suche Termine...")
+
+    # Some PLZ might be strings or ints in GSheet; the index normalizes them.
+    matches = [t for _, t in await bot_state.termine_by_plz(user_plz)]
 
-    # Filter by PLZ. Some PLZ might be strings or ints in GSheet.
-    matches = []
-    for termin in termine:
-        plz = termin.get('plz')
-        if plz and plz in user_plz:
-            matches.append(termin)
-    
     if not matches:
-        await status_msg.edit_text(f"Keine Termine für PLZ {user_plz} gefunden.")
+        no_match_msg = f"Keine Termine für PLZ {user_plz} gefunden."
+        if status_msg:
+            await status_msg.edit_text(no_match_msg)
+        else:
+            await update.message.reply_text(no_match_msg)
         return
 
-    await status_msg.delete()
+    if status_msg:
+        await status_msg.delete()
 
     msg = f"Termine für PLZ {user_plz}:\n\n"
     for t in matches:
         date_str = t.get("beginn", "Unbekannt")
         time = t.get("uhrzeit", "")
         name = t.get("name", "Stammtisch")
-        wd = gu.get_weekday_de(date_str)
-        
-        # Format date for display
-        date_display = date_str
-        if date_str != "Unbekannt":
-            try:
-                d = dt.date.fromisoformat(date_str)
-                date_display = d.strftime("%d.%m.%Y")
-            except: pass
+        wd, date_display = _fmt_de(date_str)
 
         msg += f"📅 {wd} {date_display} {time}\n📍 {name}\n\n"
     
     await update.message.reply_text(msg)
 
 
-def get_main_keyboard(user_id: str):
-    keyboard = [['Bot Info', 'Meine Termine'], ['Termin Erstellen', 'Termin Löschen']]
-    if user_id in ADMIN_IDS:
-        keyboard.append(['Nutzer Aktivieren', 'Nutzer Deaktivieren'])
-
-    return tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+def get_main_keyboard(user_id: str) -> tg.ReplyKeyboardMarkup:
+    return _ADMIN_KB if user_id in ADMIN_IDS else _USER_KB
 
 
 async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE):
@@ -363,26 +709,14 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
         context.user_data['new_event'] = {}
         
         # Find the most recent event by this user's PLZ
-        user_plz_raw = user_data.get("plz", "")
-        user_plz = {plz.strip() for plz in user_plz_raw.split(",") if plz.strip()}
-        
+        user_plz = user_data.get("_plz_set", set())
+
         log.info(f"Searching previous events for user {user_id} with PLZ {user_plz}")
-        termine = await asyncio.to_thread(bot_state.sheet.read, "termine")
-        user_events = []
-        for t in termine:
-            t_plz = str(t.get('plz', '')).strip()
-            if t_plz in user_plz:
-                user_events.append(t)
-        
-        # Sort by date (descending)
-        prev_event = None
-        if user_events:
-            try:
-                # 'beginn' is ISO format yyyy-mm-dd
-                user_events.sort(key=lambda t: t.get('beginn', ''), reverse=True)
-                prev_event = user_events[0]
-            except Exception as e:
-                log.warning(f"Error sorting previous events: {e}")
+        user_events = [t for _, t in await bot_state.termine_by_plz(user_plz)]
+
+
+        # 'beginn' is ISO format yyyy-mm-dd, so max() by string is the most recent
+        prev_event = max(user_events, key=lambda t: t.get('beginn', ''), default=None)
 
         if prev_event:
             context.user_data['prev_event'] = prev_event
@@ -421,7 +755,7 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
 
     elif flow_step == 'ask_date':
         # Simple parsing for dates like "11.03" or "am 11.03"
-        date_match = re.search(r"(\d{1,2})\.(\d{1,2})", text)
+        date_match = _DATE_RE.search(text)
         if date_match:
             try:
                 day = int(date_match.group(1))
@@ -438,9 +772,9 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
                 context.user_data['flow_step'] = 'confirm_date'
                 keyboard = [['Abbrechen', 'Ja']]
                 reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-                wd = gu.get_weekday_de(event_date.isoformat())
+                wd, date_display = _fmt_de(event_date.isoformat())
                 await update.message.reply_text(
-                    f"Der {wd} {event_date.strftime('%d.%m.%Y')} wurde erkannt. Korrekt?",
+                    f"Der {wd} {date_display} wurde erkannt. Korrekt?",
                     reply_markup=reply_markup
                 )
             except ValueError:
@@ -467,7 +801,7 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
             new_event['uhrzeit'] = prev_event.get('uhrzeit', '19:00')
         else:
             # Try parsing time
-            time_match = re.search(r"(\d{1,2})[:.](\d{2})|\b(\d{1,2})\s*Uhr", text)
+            time_match = _TIME_RE.search(text)
             if time_match:
                 if time_match.group(1):
                     new_event['uhrzeit'] = f"{int(time_match.group(1)):02d}:{int(time_match.group(2)):02d}"
@@ -495,7 +829,7 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
         if text.lower() == 'ja':
             new_event['plz'] = prev_event.get('plz') or user_data.get('plz', '').split(',')[0].strip()
         else:
-            plz_match = re.search(r"\b(\d{5})\b", text)
+            plz_match = _PLZ_RE.search(text)
             if plz_match:
                 new_event['plz'] = plz_match.group(1)
             else:
@@ -516,12 +850,7 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
 
         # --- Final Confirmation Summary ---
         date_str = new_event['beginn']
-        wd = gu.get_weekday_de(date_str)
-        try:
-            d = dt.date.fromisoformat(date_str)
-            date_display = d.strftime("%d.%m.%Y")
-        except:
-            date_display = date_str
+        wd, date_display = _fmt_de(date_str)
 
         summary = (
             "Erfassten Angaben für den neuen Termin:\n\n"
@@ -558,9 +887,11 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
         
         try:
             username = update.effective_user.username or "Unknown"
-            bot_state.sheet.log(f"User @{username} ({user_id}) created event: {new_event['name']} on {new_event['beginn']} at {new_event['plz']}")
+            bot_state.log(f"User @{username} ({user_id}) created event: {new_event['name']} on {new_event['beginn']} at {new_event['plz']}")
             await asyncio.to_thread(bot_state.sheet.append, "termine", [new_event])
-            
+            bot_state.cache_append("termine", new_event)
+
+
             success_msg = "✅ Termin wurde erfolgreich gespeichert!"
             if bot_state.sheet.sheet_id == PROD_SHEET:
                 success_msg += "\nDie Änderungen werden in 1-2 Minuten auf der Webseite sichtbar sein."
@@ -577,7 +908,7 @@ async def handle_create_event(update: tg.Update, context: tg_ext.ContextTypes.DE
                     message=f"new event for {plz}",
                     repo_paths=["data/termine.json", "www/termine.json", "www/img/"],
                 )
-                bot_state.sheet.log(f"Git push successful: new event for {plz}")
+                bot_state.log(f"Git push successful: new event for {plz}")
 
             asyncio.create_task(announce_event(context.bot, new_event))
             await update.message.reply_text(success_msg)
@@ -599,6 +930,7 @@ async def handle_delete_event(update: tg.Update, context: tg_ext.ContextTypes.DE
     async def reset_flow(msg: str):
         context.user_data['state'] = None
         context.user_data['delete_candidates'] = None
+        context.user_data['delete_btn_map'] = None
         context.user_data['selected_event_idx'] = None
         await update.message.reply_text(msg, reply_markup=get_main_keyboard(user_id))
 
@@ -608,47 +940,40 @@ async def handle_delete_event(update: tg.Update, context: tg_ext.ContextTypes.DE
 
     if current_state != 'awaiting_delete_selection':
         # --- Step 1: Fetch and display candidates ---
-        user_plz_raw = user_data.get("plz", "")
-        user_plz = {plz.strip() for plz in user_plz_raw.split(",") if plz.strip()}
-        
+        user_plz = user_data.get("_plz_set", set())
+
         await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        termine = await asyncio.to_thread(bot_state.sheet.read, "termine")
-        
-        candidates = []
-        for i, t in enumerate(termine):
-            t_plz = str(t.get('plz', '')).strip()
-            if t_plz in user_plz:
-                # Store the row index (2 for the first data row)
-                candidates.append((i + 2, t))
-        
+        # ttl=0 forces a fresh read; candidates carry live sheet row indices
+        candidates = await bot_state.termine_by_plz(user_plz, ttl=0)
+
+
         if not candidates:
             await update.message.reply_text("Ich konnte keine Termine für deine PLZ finden.")
             return
 
-        # Sort by date (descending)
-        candidates.sort(key=lambda x: x[1].get('beginn', ''), reverse=True)
-        top_4 = candidates[:4]
+        # 4 most recent by date, shown oldest first
+        top_4 = heapq.nlargest(4, candidates, key=lambda x: x[1].get('beginn', ''))
         top_4.reverse()
         
         context.user_data['state'] = 'awaiting_delete_selection'
         context.user_data['delete_candidates'] = top_4
         
         keyboard = [['Abbrechen']]
-        for _, t in top_4:
+        btn_map = {}
+        for gs_idx, t in top_4:
             # Button text: "wd dd.mm.yyyy HH:MM - PLZ"
             date_str = t.get('beginn', '?.?.?')
-            wd = gu.get_weekday_de(date_str)
+            wd, date_display = _fmt_de(date_str)
             time = t.get('uhrzeit', '?:?')
             plz = t.get('plz', '?????')
-            
-            date_display = date_str
-            try:
-                d = dt.date.fromisoformat(date_str)
-                date_display = d.strftime("%d.%m.%Y")
-            except: pass
 
-            keyboard.append([f"{wd} {date_display} {time} - {plz}"])
-            
+            btn_text = f"{wd} {date_display} {time} - {plz}"
+            btn_map[btn_text] = (gs_idx, t)
+            keyboard.append([btn_text])
+
+        context.user_data['delete_btn_map'] = btn_map
+
+
         reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
         await update.message.reply_text(
             "Welchen Termin möchten Sie löschen?",
@@ -661,39 +986,19 @@ async def handle_delete_event(update: tg.Update, context: tg_ext.ContextTypes.DE
     selected_idx = context.user_data.get('selected_event_idx')
 
     if selected_idx is None:
-        # User is selecting from buttons
-        match = None
-        for i, (gs_idx, t) in enumerate(candidates):
-            date_str = t.get('beginn', '?.?.?')
-            wd = gu.get_weekday_de(date_str)
-            time = t.get('uhrzeit', '?:?')
-            plz = t.get('plz', '?????')
-            
-            date_display = date_str
-            try:
-                d = dt.date.fromisoformat(date_str)
-                date_display = d.strftime("%d.%m.%Y")
-            except: pass
+        # User is selecting from buttons: the map was built when the
+        # buttons were sent, so there is no re-formatting per click.
+        match = context.user_data.get('delete_btn_map', {}).get(text)
 
-            btn_text = f"{wd} {date_display} {time} - {plz}"
-            if text == btn_text:
-                match = (i, gs_idx, t)
-                break
-        
         if not match:
             await update.message.reply_text("Bitte wähle einen der Termine über die Buttons aus.")
             return
-        
-        i, gs_idx, t = match
+
+        gs_idx, t = match
         context.user_data['selected_event_idx'] = gs_idx
         
         date_str = t.get('beginn', '?.?.?')
-        wd = gu.get_weekday_de(date_str)
-        try:
-            d = dt.date.fromisoformat(date_str)
-            date_display = d.strftime("%d.%m.%Y")
-        except:
-            date_display = date_str
+        wd, date_display = _fmt_de(date_str)
 
         # Confirm deletion
         summary = (
@@ -723,10 +1028,12 @@ async def handle_delete_event(update: tg.Update, context: tg_ext.ContextTypes.DE
             try:
                 if target_event:
                     username = update.effective_user.username or "Unknown"
-                    bot_state.sheet.log(f"User @{username} ({user_id}) deleted event: {target_event.get('name')} on {target_event.get('beginn')} at {target_event.get('plz')}")
+                    bot_state.log(f"User @{username} ({user_id}) deleted event: {target_event.get('name')} on {target_event.get('beginn')} at {target_event.get('plz')}")
                 
                 await asyncio.to_thread(bot_state.sheet.delete_row, "termine", gs_idx)
-                
+                bot_state.cache_delete("termine", gs_idx)
+
+
                 success_msg = "✅ Termin wurde gelöscht."
                 if bot_state.sheet.sheet_id == PROD_SHEET:
                     success_msg += "\nDie Änderungen werden in 1-2 Minuten auf der Webseite sichtbar sein."
@@ -742,7 +1049,7 @@ async def handle_delete_event(update: tg.Update, context: tg_ext.ContextTypes.DE
                             message=f"delete event for {plz}",
                             repo_paths=["data/termine.json", "www/termine.json", "www/img/"],
                         )
-                        bot_state.sheet.log(f"Git push successful: delete event for {plz}")
+                        bot_state.log(f"Git push successful: delete event for {plz}")
 
                 await update.message.reply_text(success_msg)
             except Exception as e:
@@ -754,154 +1061,186 @@ async def handle_delete_event(update: tg.Update, context: tg_ext.ContextTypes.DE
             await update.message.reply_text("Bitte bestätige mit 'Ja' oder nutze 'Abbrechen'.")
 
 
-async def handle_manage_users(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE):
+async def _mu_reset_flow(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE, msg: str):
     user_id = str(update.effective_user.id)
-    bot_state: BotState = context.bot_data['state']
-    
-    current_state = context.user_data.get('state')
-    text = (update.message.text if update.message else "").strip()
-    log.info(f"handle_manage_users: state={current_state}, text='{text}'")
+    context.user_data['state'] = None
+    context.user_data['manage_candidates'] = None
+    context.user_data['selected_user_data'] = None
+    context.user_data['target_status'] = None
+    await update.message.reply_text(msg, reply_markup=get_main_keyboard(user_id))
 
-    async def reset_flow(msg: str):
-        context.user_data['state'] = None
-        context.user_data['manage_candidates'] = None
-        context.user_data['selected_user_data'] = None
-        context.user_data['target_status'] = None
-        await update.message.reply_text(msg, reply_markup=get_main_keyboard(user_id))
 
-    if text.lower() == "abbrechen":
-        await reset_flow("Vorgang abgebrochen.")
+async def _mu_show_candidates(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE, text: str):
+    # --- Step 1: Fetch and display candidates ---
+    bot_state: BotState = context.bot_data['state']
+    activating = text.casefold() == "nutzer aktivieren"
+    target_status = "Aktiv" if activating else "Deaktiviert"
+    context.user_data['target_status'] = target_status
+
+    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+    # served from the cache in the typical admin flow; our own writes
+    # keep it authoritative, see _mu_confirm below
+    rows = await bot_state.read_cached("kontakte")
+
+    # Activating shows anyone who isn't already "Aktiv",
+    # deactivating shows anyone who is.
+    want_active = not activating
+    candidates = [
+        (i + 2, row)
+        for i, row in enumerate(rows)
+        if (row.get("bot_modus", "").strip() == "Aktiv") == want_active
+    ]
+
+    if not candidates:
+        await update.message.reply_text(f"Keine Nutzer gefunden, die {text.lower()} werden können.")
         return
 
-    if text in ("Nutzer Aktivieren", "Nutzer Deaktivieren"):
-        # --- Step 1: Fetch and display candidates ---
-        target_status = "Aktiv" if text == "Nutzer Aktivieren" else "Deaktiviert"
-        context.user_data['target_status'] = target_status
-        
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        rows = await asyncio.to_thread(bot_state.sheet.read, "kontakte")
-        
-        candidates = []
-        for i, row in enumerate(rows):
-            current_status = row.get("bot_modus", "").strip()
-            # If activating, show anyone who isn't already "Aktiv"
-            # If deactivating, show anyone who is "Aktiv"
-            if text == "Nutzer Aktivieren" and current_status != "Aktiv":
-                candidates.append((i + 2, row))
-            elif text == "Nutzer Deaktivieren" and current_status == "Aktiv":
-                candidates.append((i + 2, row))
-        
-        if not candidates:
-            await update.message.reply_text(f"Keine Nutzer gefunden, die {text.lower()} werden können.")
-            return
+    context.user_data['state'] = 'awaiting_user_selection'
 
-        context.user_data['state'] = 'awaiting_user_selection'
-        context.user_data['manage_candidates'] = candidates
-        
-        keyboard = [['Abbrechen']]
-        for _, row in candidates:
-            name = row.get("name", "Unbekannt")
-            username = row.get("username", "")
-            btn_text = f"{name} (@{username})" if username else name
-            keyboard.append([btn_text])
-            
-        reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(
-            f"Welchen Nutzer möchten Sie {target_status.lower()}?",
-            reply_markup=reply_markup
-        )
+    # map button text to its row, so the selection branch is a dict
+    # lookup instead of rebuilding every label for comparison
+    btn_map = {}
+    keyboard = [['Abbrechen']]
+    for gs_idx, row in candidates:
+        name = row.get("name", "Unbekannt")
+        username = row.get("username", "")
+        btn_text = f"{name} (@{username})" if username else name
+        btn_map[btn_text] = (gs_idx, row)
+        keyboard.append([btn_text])
+
+    context.user_data['manage_candidates'] = btn_map
+
+    reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    await update.message.reply_text(
+        f"Welchen Nutzer möchten Sie {target_status.lower()}?",
+        reply_markup=reply_markup
+    )
+
+
+async def _mu_selection(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE, text: str):
+    candidates = context.user_data.get('manage_candidates', {})
+    target_status = context.user_data.get('target_status')
+
+    match = candidates.get(text)
+
+    if not match:
+        await update.message.reply_text("Bitte wählen Sie einen Nutzer über die Buttons aus.")
         return
 
-    if current_state == 'awaiting_user_selection':
-        candidates = context.user_data.get('manage_candidates', [])
-        target_status = context.user_data.get('target_status')
-        
-        match = None
-        for gs_idx, row in candidates:
-            name = row.get("name", "Unbekannt")
-            username = row.get("username", "")
-            btn_text = f"{name} (@{username})" if username else name
-            if text == btn_text:
-                match = (gs_idx, row)
-                break
-        
-        if not match:
-            await update.message.reply_text("Bitte wählen Sie einen Nutzer über die Buttons aus.")
-            return
-        
-        gs_idx, row = match
-        context.user_data['selected_user_data'] = (gs_idx, row)
-        context.user_data['state'] = 'awaiting_user_confirm'
-        
-        summary = (
-            f"Möchten Sie diesen Nutzer wirklich {target_status.lower()}?\n\n"
-            f"👤 Name: {row.get('name')}\n"
-            f"🆔 Telegram ID: {row.get('telegram_id')}\n"
-            f"🏷 Username: @{row.get('username', 'N/A')}\n"
-        )
-        keyboard = [['Abbrechen', 'Ja']]
-        reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(summary, reply_markup=reply_markup)
+    gs_idx, row = match
+    context.user_data['selected_user_data'] = (gs_idx, row)
+    context.user_data['state'] = 'awaiting_user_confirm'
+
+    summary = (
+        f"Möchten Sie diesen Nutzer wirklich {target_status.lower()}?\n\n"
+        f"👤 Name: {row.get('name')}\n"
+        f"🆔 Telegram ID: {row.get('telegram_id')}\n"
+        f"🏷 Username: @{row.get('username', 'N/A')}\n"
+    )
+    keyboard = [['Abbrechen', 'Ja']]
+    reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    await update.message.reply_text(summary, reply_markup=reply_markup)
+
+
+async def _mu_confirm(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE, text: str):
+    user_id = str(update.effective_user.id)
+    bot_state: BotState = context.bot_data['state']
+
+    if text.lower() != 'ja':
+        await update.message.reply_text("Bitte bestätigen Sie mit 'Ja' oder nutzen Sie 'Abbrechen'.")
         return
 
-    if current_state == 'awaiting_user_confirm':
-        if text.lower() != 'ja':
-            await update.message.reply_text("Bitte bestätigen Sie mit 'Ja' oder nutzen Sie 'Abbrechen'.")
+    gs_idx, row = context.user_data.get('selected_user_data')
+    target_status = context.user_data.get('target_status')
+
+    await update.message.reply_text(f"Setze Status auf '{target_status}' in GSheet...")
+    await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+
+    try:
+        # We need to find the column index for "Bot modus"
+        col_idx = await asyncio.to_thread(bot_state.col_index, "kontakte", "bot_modus")
+
+        if col_idx == -1:
+            # Append header if missing? Better to fail safely
+            await update.message.reply_text("❌ Fehler: Spalte 'Bot modus' nicht gefunden.")
             return
 
-        gs_idx, row = context.user_data.get('selected_user_data')
-        target_status = context.user_data.get('target_status')
+        range_name = f"{_col_letter(col_idx)}{gs_idx}"
+
+        # Perform update, coalesced with any other pending admin writes
+        bot_state.ensure_background_tasks()
+        done = asyncio.get_running_loop().create_future()
+        bot_state.write_queue.put_nowait((
+            {"range": f"kontakte!{range_name}", "values": [[target_status]]},
+            done,
+        ))
+        await asyncio.wait_for(done, timeout=30.0)
+
+        bot_state.set_user_status(row, target_status)
+
+        if target_status == "Aktiv":
+            user_tg_id = row.get("telegram_id")
+            if user_tg_id:
+                msg = (
+                    WELCOME_MESSAGE +
+                    "Ihr Konto wurde aktiviert und Sie können jetzt Termine für Ihren Stammtisch verwalten.\n\n" +
+                    "Um Befehle zu initiieren, schreibe: /start"
+                )
+                await context.bot.send_message(chat_id=user_tg_id, text=msg)
 
-        await update.message.reply_text(f"Setze Status auf '{target_status}' in GSheet...")
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+        admin_username = update.effective_user.username or "Unknown"
+        bot_state.log(f"Admin @{admin_username} ({user_id}) set status of {row.get('telegram_id')} ({row.get('name')}) to {target_status}")
+        await update.message.reply_text(f"✅ Nutzer wurde erfolgreich {target_status.lower()}.")
+    except Exception as e:
+        log.error(f"Error updating user status: {e}")
+        await update.message.reply_text("❌ Fehler beim Aktualisieren. Bitte versuche es später erneut.")
 
-        try:
-            # We need to find the column index for "Bot modus"
-            headers = await asyncio.to_thread(bot_state.sheet._get_headers, "kontakte")
-            col_idx = -1
-            for i, h in enumerate(headers):
-                if gu._normalize_key(h) == "bot_modus":
-                    col_idx = i
-                    break
+    await _mu_reset_flow(update, context, "Was kann ich sonst für dich tun?")
 
-            if col_idx == -1:
-                # Append header if missing? Better to fail safely
-                await update.message.reply_text("❌ Fehler: Spalte 'Bot modus' nicht gefunden.")
-                return
 
-            # Convert col_idx to A, B, C...
-            col_letter = chr(ord('A') + col_idx)
-            range_name = f"{col_letter}{gs_idx}"
-
-            # Perform update
-            body = {"values": [[target_status]]}
-            bot_state.sheet.service.spreadsheets().values().update(
-                spreadsheetId=bot_state.sheet.sheet_id,
-                range=f"kontakte!{range_name}",
-                valueInputOption="RAW",
-                body=body
-            ).execute()
+# flow-step -> handler, so dispatch is one dict lookup instead of
+# comparing current_state against every state string in turn
+_MANAGE_HANDLERS: dict[str, typ.Callable] = {
+    'awaiting_user_selection': _mu_selection,
+    'awaiting_user_confirm': _mu_confirm,
+}
 
-            bot_state.sync_users()
-
-            if target_status == "Aktiv":
-                user_tg_id = row.get("telegram_id")
-                if user_tg_id:
-                    msg = (
-                        WELCOME_MESSAGE +
-                        "Ihr Konto wurde aktiviert und Sie können jetzt Termine für Ihren Stammtisch verwalten.\n\n" +
-                        "Um Befehle zu initiieren, schreibe: /start"
-                    )
-                    await context.bot.send_message(chat_id=user_tg_id, text=msg)
-
-            admin_username = update.effective_user.username or "Unknown"
-            bot_state.sheet.log(f"Admin @{admin_username} ({user_id}) set status of {row.get('telegram_id')} ({row.get('name')}) to {target_status}")
-            await update.message.reply_text(f"✅ Nutzer wurde erfolgreich {target_status.lower()}.")
-        except Exception as e:
-            log.error(f"Error updating user status: {e}")
-            await update.message.reply_text("❌ Fehler beim Aktualisieren. Bitte versuche es später erneut.")
 
-        await reset_flow("Was kann ich sonst für dich tun?")
+async def handle_manage_users(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE):
+    current_state = context.user_data.get('state')
+    text = (update.message.text if update.message else "").strip()
+    log.info(f"handle_manage_users: state={current_state}, text='{text}'")
+
+    # casefolded like _COMMANDS, so lowercase shorthands dispatch too
+    cmd = text.casefold()
+    if cmd == "abbrechen":
+        await _mu_reset_flow(update, context, "Vorgang abgebrochen.")
+    elif cmd in ("nutzer aktivieren", "nutzer deaktivieren"):
+        await _mu_show_candidates(update, context, text)
+    else:
+        handler = _MANAGE_HANDLERS.get(current_state)
+        if handler is not None:
+            await handler(update, context, text)
+        else:
+            await update.message.reply_text("Ich habe dich nicht verstanden.\nNutze /start.")
+
+
+# keyboard labels and shorthands, casefolded once at import so
+# handle_message does a single dict lookup instead of chained compares
+_COMMANDS: dict[str, typ.Callable] = {
+    "bot info": handle_bot_info,
+    "botinfo": handle_bot_info,
+    "info": handle_bot_info,
+    "meine termine": list_my_events,
+    "termine": list_my_events,
+    "nutzer aktivieren": handle_manage_users_cmd,
+    "nutzer deaktivieren": handle_manage_users_cmd,
+    "termin erstellen": handle_create_event,
+    "erstellen": handle_create_event,
+    "neu": handle_create_event,
+    "termin löschen": handle_delete_event,
+    "löschen": handle_delete_event,
+}
 
 
 async def handle_start(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_TYPE) -> None:
@@ -920,17 +1259,10 @@ async def handle_start(update: tg.Update, context: tg_ext.ContextTypes.DEFAULT_T
         log.warning(f"Unauthorized access attempt from {tg_id} (@{update.effective_user.username})")
         return
 
-    keyboard = [['Bot Info', 'Meine Termine'], ['Termin Erstellen', 'Termin Löschen']]
-
-    if tg_id in ADMIN_IDS:
-        keyboard.append(['Nutzer Aktivieren', 'Nutzer Deaktivieren'])
-
-    reply_markup = tg.ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-
     await update.message.reply_text(
         WELCOME_MESSAGE +
         "Wie kann ich Ihnen helfen?",
-        reply_markup=reply_markup
+        reply_markup=get_main_keyboard(tg_id)
     )
 
 
@@ -993,7 +1325,27 @@ def main() -> int:
     # state = BotState(sheet_id)
     # state.sync_users()
 
-    app = tg_ext.ApplicationBuilder().token(FSTISCH_BOT_TOKEN).build()
+    # The limiter spreads bursts (announcement + pin + poll) below the
+    # Bot API flood limits and transparently retries on RetryAfter.
+    rate_limiter = tg_ext.AIORateLimiter(overall_max_rate=30, group_max_rate=20)
+    # One pooled keep-alive client per purpose (PTB wants separate
+    # instances for get_updates), so bursts don't pay TCP/TLS setup.
+    request = tg.request.HTTPXRequest(
+        connection_pool_size=64, connect_timeout=5.0, read_timeout=20.0, http_version="2"
+    )
+    updates_request = tg.request.HTTPXRequest(http_version="2")
+    # block=False runs handlers as tasks, so a slow Sheets call in one
+    # chat does not stall every other user's commands
+    defaults = tg_ext.Defaults(block=False)
+    app = (
+        tg_ext.ApplicationBuilder()
+        .token(FSTISCH_BOT_TOKEN)
+        .request(request)
+        .get_updates_request(updates_request)
+        .rate_limiter(rate_limiter)
+        .defaults(defaults)
+        .build()
+    )
     app.bot_data['ctx'] = {'sheet_id': sheet_id}
 
     app.add_handler(tg_ext.MessageHandler(tg_ext.filters.TEXT, dispatch_handler))
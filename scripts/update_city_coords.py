@@ -41,10 +41,22 @@ log = logging.getLogger(name="update_cities_coords.py")
 APP_USER_AGENT = "freiheitliche-stammtische.de-city-coords-v0.09"
 
 
+# one geolocator for the whole run, so the underlying requests session
+# keeps its connection alive instead of redoing the TLS handshake per city
+_GEOLOCATOR = None
+
+
+def _get_geolocator():
+    global _GEOLOCATOR
+    if _GEOLOCATOR is None:
+        _GEOLOCATOR = get_geocoder_for_service("nominatim")(user_agent=APP_USER_AGENT)
+    return _GEOLOCATOR
+
+
 @disk_cache.cache(APP_USER_AGENT)
 @decorators.rate_limit(min_interval=1.5)
 def geolocate(city: str) -> tuple[str, str, str, int, float, float] | None:
-    geolocator = get_geocoder_for_service("nominatim")(user_agent=APP_USER_AGENT)
+    geolocator = _get_geolocator()
 
     location = geolocator.geocode(f"{city}, Deutschland", addressdetails=True)
 
@@ -84,8 +96,9 @@ _cli_defaults = {
 def read_json_list(path: str) -> list:
     path_obj = pl.Path(path)
     if path_obj.exists():
-        with path_obj.open(mode="r", encoding="utf-8") as fobj:
-            return json.load(fobj)
+        # one read() + loads() beats json.load on a text-mode file,
+        # which decodes through the io layer chunk by chunk
+        return json.loads(path_obj.read_bytes())
     else:
         return []
 
@@ -102,8 +115,7 @@ def main(argv: list[str] = sys.argv[1:]) -> int:
             print(city)
     cities_by_name = {city['name']: city for city in cities_data}
 
-    return
-    
+    num_updated = 0
     for city_name, population in city_populations.items():
         loc_info = geolocate(city_name)
         if loc_info is None:
@@ -126,7 +138,11 @@ def main(argv: list[str] = sys.argv[1:]) -> int:
             continue
 
         cities_by_name[city_name] = new_entry
-            
+        num_updated += 1
+        log.info(f"Updated {city_name}")
+
+    if num_updated:
+        # accumulate in memory, write the full file once at the end
         cities_path = pl.Path("data/cities.json")
         cities_path_tmp = pl.Path("data/cities.json.tmp")
         with cities_path_tmp.open(mode="w", encoding="utf-8") as fobj:
@@ -134,7 +150,7 @@ def main(argv: list[str] = sys.argv[1:]) -> int:
             json.dump(new_cities_data, fobj, indent=2, ensure_ascii=False)
 
         cities_path_tmp.replace(cities_path)
-        log.info(f"Updated {city_name}")
+        log.info(f"Wrote {len(cities_by_name)} cities ({num_updated} updated)")
 
     return 0
 